@@ -1,285 +1,833 @@
 import os
-import pandas as pd
+import fitz  # PyMuPDF
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from PyPDF2 import PdfReader, PdfWriter
 from datetime import datetime
+import csv
+import json
+import logging
+import mmap
 import re
 
-def extract_pdf_metadata(filepath):
-    """Extract only existing metadata from a PDF file."""
-    try:
-        reader = PdfReader(filepath)
-        
-        # Handle encrypted PDFs
-        if reader.is_encrypted:
-            return create_error_metadata(filepath, 'Encrypted PDF')
-        
-        # Safely get metadata
-        try:
-            info = reader.metadata or {}
-        except Exception as e:
-            return create_error_metadata(filepath, f'Metadata error: {str(e)}')
-        
-        filename = sanitize_field(os.path.basename(filepath))
-        filepath = sanitize_field(filepath)
-        
-        # Safely extract all metadata fields
-        metadata = {}
-        for field, key in [
-            ('title', '/Title'),
-            ('author', '/Author'),
-            ('subject', '/Subject'),
-            ('tags', '/Keywords'),
-        ]:
-            try:
-                value = info.get(key, None)
-                if hasattr(value, 'get_object'):
-                    try:
-                        value = value.get_object()
-                    except Exception:
-                        value = None
-                metadata[field] = sanitize_field(value) if value else None
-            except Exception:
-                metadata[field] = None
-        
-        # Safely extract date
-        pdf_date = None
-        raw_date = None
-        try:
-            raw_date = info.get('/CreationDate', None)
-            if hasattr(raw_date, 'get_object'):
-                try:
-                    raw_date = raw_date.get_object()
-                except Exception:
-                    raw_date = None
-                    
-            if raw_date and isinstance(raw_date, str) and raw_date.startswith("D:"):
-                try:
-                    pdf_date = datetime.strptime(raw_date[2:14], "%Y%m%d%H%M")
-                except ValueError:
-                    pass
-        except Exception:
-            raw_date = None
-        
-        return {
-            'filename': filename,
-            'filepath': filepath,
-            'has_title': metadata['title'] is not None,
-            'title': metadata['title'],
-            'has_author': metadata['author'] is not None,
-            'author': metadata['author'],
-            'has_subject': metadata['subject'] is not None,
-            'subject': metadata['subject'],
-            'has_tags': metadata['tags'] is not None,
-            'tags': metadata['tags'],
-            'has_date': pdf_date is not None,
-            'date': pdf_date,
-            'raw_date_string': sanitize_field(raw_date),
-            'error': None
-        }
-    except Exception as e:
-        error_msg = str(e)
-        if "PyCryptodome is required" in error_msg:
-            error_msg = "Encrypted PDF (requires PyCryptodome)"
-        elif "EOF marker not found" in error_msg:
-            error_msg = "Corrupted PDF (EOF marker not found)"
-            
-        print(f"Error processing {filepath}: {error_msg}")
-        return create_error_metadata(filepath, error_msg)
+
+# Hot-loop failure messages go through one stderr logger instead of
+# per-file print() calls, keeping them out of the interactive stdout
+# stream (progress lines, prompts) and off the redirected CSV summaries
+logger = logging.getLogger('pdf_metadata_scanner')
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter('%(message)s'))
+logger.addHandler(_log_handler)
+logger.setLevel(logging.INFO)
+
+# Dialect shared by every CSV writer in the module: minimal quoting
+# and bare \n line endings, matching what the old pandas outputs used
+csv.register_dialect('metapdf', quoting=csv.QUOTE_MINIMAL, lineterminator='\n')
+
+# Column order for the metadata CSV outputs
+METADATA_FIELDS = [
+    'filename', 'filepath', 'has_title', 'title', 'has_author', 'author',
+    'has_subject', 'subject', 'has_tags', 'tags', 'has_date', 'date',
+    'raw_date_string', 'error'
+]
+
+# Translation table for sanitize_field; str.translate runs in C
+COMMA_TABLE = str.maketrans(',', ';')
+
+# Deletion table for turning a parsed date into a D:YYYYMMDD value
+DATE_STRIP_TABLE = str.maketrans('', '', '- :')
+
+# Summary block for import_author_metadata, emitted in one write
+AUTHOR_IMPORT_SUMMARY = """
+Author Import Summary:
+Total entries processed: {total_files}
+PDF metadata updated: {metadata_written}
+Files renamed: {files_renamed}
+Encrypted files skipped: {encrypted_files}
+Errors encountered: {errors}"""
 
 def sanitize_field(value):
     """Replace commas with semicolons in a field value."""
     if value is None:
         return None
-    return str(value).replace(',', ';')
+    # Fast paths for the common cases; str() on a str still pays a
+    # dispatch through the type machinery
+    t = type(value)
+    if t is str:
+        return value.translate(COMMA_TABLE)
+    if t is bytes:
+        return value.decode('utf-8', 'replace').translate(COMMA_TABLE)
+    return str(value).translate(COMMA_TABLE)
+
+# Tail-scan patterns for the fast /Info path (classic xref tables only)
+STARTXREF_PATTERN = re.compile(rb'startxref\s+(\d+)')
+TRAILER_INFO_PATTERN = re.compile(rb'/Info\s+(\d+)\s+\d+\s+R')
+INFO_FIELD_PATTERN = re.compile(
+    rb'/(Title|Author|Subject|Keywords|CreationDate)\s*\(((?:\\.|[^\\()])*)\)'
+)
+INFO_KEY_PATTERN = re.compile(rb'/(Title|Author|Subject|Keywords|CreationDate)\b')
+
+# Simple literal-string escapes per the PDF spec (table 3, 7.3.4.2)
+PDF_STRING_ESCAPES = {
+    b'n': b'\n', b'r': b'\r', b't': b'\t', b'b': b'\b', b'f': b'\f',
+    b'(': b'(', b')': b')', b'\\': b'\\',
+}
+OCTAL_DIGITS = frozenset(b'01234567')
+
+def decode_pdf_string(raw):
+    """Decode a PDF literal string, handling UTF-16BE and the spec's
+    full escape set: the simple escapes, \\ddd octal codes, escaped
+    line continuations, and a dropped backslash before anything else.
+    """
+    if b'\\' in raw:
+        out = bytearray()
+        i, n = 0, len(raw)
+        while i < n:
+            ch = raw[i]
+            i += 1
+            if ch != 0x5C:  # backslash
+                out.append(ch)
+                continue
+            if i >= n:
+                break  # a trailing lone backslash is dropped
+            nxt = raw[i]
+            simple = PDF_STRING_ESCAPES.get(raw[i:i + 1])
+            if simple is not None:
+                out += simple
+                i += 1
+            elif nxt in OCTAL_DIGITS:
+                # One to three octal digits; overflow wraps per spec
+                j = i + 1
+                while j < min(i + 3, n) and raw[j] in OCTAL_DIGITS:
+                    j += 1
+                out.append(int(raw[i:j], 8) & 0xFF)
+                i = j
+            elif nxt in (0x0D, 0x0A):
+                # Escaped end-of-line is a line continuation: swallow
+                # the newline (and the LF of a CRLF pair)
+                i += 1
+                if nxt == 0x0D and i < n and raw[i] == 0x0A:
+                    i += 1
+            else:
+                # Backslash before any other character is ignored
+                out.append(nxt)
+                i += 1
+        raw = bytes(out)
+    if raw.startswith(b'\xfe\xff'):
+        try:
+            return raw[2:].decode('utf-16-be')
+        except UnicodeDecodeError:
+            return None
+    return raw.decode('latin-1')
+
+def fast_metadata(filepath):
+    """Read /Info directly by scanning the file tail for the xref.
+
+    Reads only the last ~2 KiB to find startxref and the trailer's /Info
+    reference, then seeks straight to the xref entry and the /Info object.
+    Returns a metadata dict shaped like fitz's doc.metadata, or None when
+    the file needs the full parser (encryption, xref streams, odd strings).
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                # Slices of the map are served from the page cache with no
+                # intermediate read() buffers
+                tail = mm[max(0, size - 2048):size]
+
+                # Encrypted or xref-stream files need the full parser
+                if b'/Encrypt' in tail:
+                    return None
+
+                xref_matches = STARTXREF_PATTERN.findall(tail)
+                info_match = TRAILER_INFO_PATTERN.search(tail)
+                if not xref_matches or not info_match:
+                    return None
+
+                xref_offset = int(xref_matches[-1])
+                info_num = int(info_match.group(1))
+                if xref_offset >= size:
+                    return None
+
+                # Parse the classic xref table to find the /Info object offset
+                xref_data = mm[xref_offset:xref_offset + 65536]
+                if not xref_data.startswith(b'xref'):
+                    return None  # cross-reference stream; fall back
+
+                obj_offset = None
+                pos = 4
+                while pos < len(xref_data):
+                    header = re.match(rb'\s*(\d+)\s+(\d+)\s*[\r\n]+', xref_data[pos:pos + 64])
+                    if not header:
+                        break
+                    start, count = int(header.group(1)), int(header.group(2))
+                    entries_at = pos + header.end()
+                    if start <= info_num < start + count:
+                        entry = xref_data[entries_at + (info_num - start) * 20:
+                                          entries_at + (info_num - start) * 20 + 20]
+                        if entry[17:18] != b'n':
+                            return None
+                        obj_offset = int(entry[:10])
+                        break
+                    pos = entries_at + count * 20
+                if obj_offset is None or obj_offset >= size:
+                    return None
+
+                # Window the object region and regex out the fields
+                window = mm[obj_offset:obj_offset + 8192]
+                end = window.find(b'endobj')
+                if end == -1:
+                    return None
+                window = window[:end]
+
+                # The field regex only understands plain literal
+                # strings. If the Info dict mentions any of our keys
+                # with a value it could not parse (indirect reference,
+                # hex string, nested parens), the fast path would
+                # silently drop that field while reporting success, so
+                # hand the file to the full parser instead
+                matches = INFO_FIELD_PATTERN.findall(window)
+                if len(matches) != len(INFO_KEY_PATTERN.findall(window)):
+                    return None
+
+                info = {}
+                for key, value in matches:
+                    decoded = decode_pdf_string(value)
+                    if decoded is None:
+                        return None
+                    field = key.decode('ascii')
+                    field = 'creationDate' if field == 'CreationDate' else field.lower()
+                    info[field] = decoded
+                return info
+    except (OSError, ValueError):
+        return None
+
+def tail_has_encrypt(filepath):
+    """Cheap trailer probe: True if the file tail references /Encrypt.
+
+    Encrypted PDFs carry /Encrypt in the trailer dictionary, which sits
+    in the last couple of KiB for classic files. Reading just that tail
+    lets the write paths skip encrypted files without constructing a
+    full PdfReader. Returns False when unsure (unreadable, xref
+    streams), so callers still need the authoritative is_encrypted
+    check before writing.
+    """
+    try:
+        with open(filepath, 'rb') as f:
+            size = f.seek(0, 2)
+            f.seek(max(0, size - 2048))
+            return b'/Encrypt' in f.read()
+    except OSError:
+        return False
+
+def atomic_pdf_write(writer, filepath, buffering=1 << 22):
+    """Serialize a PdfWriter over filepath via a .tmp + atomic replace.
+
+    The large buffer batches PdfWriter's many small writes; the temp
+    file is removed if serialization fails so interrupted runs leave
+    no .tmp litter behind.
+    """
+    temp_filepath = filepath + '.tmp'
+    try:
+        with open(temp_filepath, 'wb', buffering=buffering) as output_file:
+            writer.write(output_file)
+        os.replace(temp_filepath, filepath)
+    except BaseException:
+        try:
+            os.unlink(temp_filepath)
+        except OSError:
+            pass
+        raise
+
+def rename_no_clobber(src, dst):
+    """Rename src to dst, refusing to overwrite an existing dst.
+
+    POSIX rename overwrites silently, so the destination entry is
+    claimed first with an O_EXCL create (raising FileExistsError
+    atomically if it is taken) and os.replace then swaps the real file
+    in. Case-only renames skip the claim: on a case-insensitive
+    filesystem the "existing" destination is src itself.
+    """
+    if src.lower() == dst.lower():
+        os.rename(src, dst)
+        return
+    fd = os.open(dst, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    os.close(fd)
+    try:
+        os.replace(src, dst)
+    except BaseException:
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        raise
+
+def build_metadata_result(filename, filepath, info):
+    """Build the standard metadata dict from a fitz-style info dict."""
+    metadata = {}
+    for field, key in [
+        ('title', 'title'),
+        ('author', 'author'),
+        ('subject', 'subject'),
+        ('tags', 'keywords'),
+    ]:
+        value = info.get(key, None)
+        metadata[field] = sanitize_field(value) if value else None
+
+    pdf_date = None
+    raw_date = info.get('creationDate', None) or None
+    if raw_date and isinstance(raw_date, str) and raw_date.startswith("D:"):
+        # Manual slicing of D:YYYYMMDDHHMM; strptime reparses its format
+        # string on every call and is several times slower
+        try:
+            pdf_date = datetime(int(raw_date[2:6]), int(raw_date[6:8]),
+                                int(raw_date[8:10]), int(raw_date[10:12]),
+                                int(raw_date[12:14]))
+        except (ValueError, IndexError):
+            pass
 
-def create_error_metadata(filepath, error_msg):
-    """Create metadata dictionary for error cases."""
     return {
-        'filename': sanitize_field(os.path.basename(filepath)),
-        'filepath': sanitize_field(filepath),
-        'has_title': False,
-        'title': None,
-        'has_author': False,
-        'author': None,
-        'has_subject': False,
-        'subject': None,
-        'has_tags': False,
-        'tags': None,
-        'has_date': False,
-        'date': None,
-        'raw_date_string': None,
-        'error': error_msg
+        'filename': filename,
+        'filepath': filepath,
+        'has_title': metadata['title'] is not None,
+        'title': metadata['title'],
+        'has_author': metadata['author'] is not None,
+        'author': metadata['author'],
+        'has_subject': metadata['subject'] is not None,
+        'subject': metadata['subject'],
+        'has_tags': metadata['tags'] is not None,
+        'tags': metadata['tags'],
+        'has_date': pdf_date is not None,
+        'date': pdf_date,
+        'raw_date_string': sanitize_field(raw_date),
+        'error': None
     }
 
-def scan_pdfs(root_folder):
-    """Recursively scan folder for PDFs and extract metadata."""
-    pdf_data = []
-    error_data = []
-    total_pdfs = 0
-    error_counts = {}
-    object_error_files = []
-    encrypted_files = []
-    corrupted_files = []
-    
-    for root, _, files in os.walk(root_folder):
-        for file in files:
-            if file.lower().endswith('.pdf'):
-                total_pdfs += 1
-                filepath = os.path.join(root, file)
-                metadata = extract_pdf_metadata(filepath)
-                
-                if metadata:
-                    pdf_data.append(metadata)
-                    # Track error types
-                    error = metadata.get('error')
-                    if error:
-                        error_counts[error] = error_counts.get(error, 0) + 1
-                        # Track files with specific errors
-                        if "Object" in error:
-                            object_error_files.append(filepath)
-                        if "Encrypted PDF" in error:
-                            encrypted_files.append(filepath)
-                        if "Corrupted PDF" in error:
-                            corrupted_files.append(filepath)
-                        # Add to error data
-                        error_data.append({
-                            'filename': metadata['filename'],
-                            'filepath': metadata['filepath'],
-                            'error_type': error
-                        })
+def extract_pdf_metadata(filepath, basename=None, _basename=os.path.basename,
+                         _sanitize=sanitize_field):
+    """Extract only existing metadata from a PDF file.
+
+    Callers that already hold the basename can pass it to skip the split.
+    The trailing default arguments bind hot global names as fast locals;
+    this function runs once per file across the whole archive.
+    """
+    # Sanitize the names once; both success and error paths reuse them
+    sfname = _sanitize(basename or _basename(filepath))
+    spath = _sanitize(filepath)
 
-    # Print statistics
+    # Fast path: pull /Info straight from the xref without a full parse
+    info = fast_metadata(filepath)
+    if info is not None:
+        return build_metadata_result(sfname, spath, info)
+
+    doc = None
+    try:
+        # One sequential read keeps OS readahead effective and lets MuPDF
+        # parse from memory instead of issuing many small reads
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        doc = fitz.open(stream=data, filetype='pdf')
+
+        # Handle encrypted PDFs
+        if doc.needs_pass:
+            return create_error_metadata(sfname, spath, 'Encrypted PDF')
+
+        # Safely get metadata (a plain dict in PyMuPDF)
+        try:
+            info = doc.metadata or {}
+        except Exception as e:
+            return create_error_metadata(sfname, spath, f'Metadata error: {str(e)}')
+
+        return build_metadata_result(sfname, spath, info)
+    except Exception as e:
+        error_msg = str(e)
+        if isinstance(e, fitz.FileDataError) or "cannot open" in error_msg:
+            error_msg = f"Corrupted PDF ({error_msg})"
+
+        logger.error(f"Error processing {filepath}: {error_msg}")
+        return create_error_metadata(sfname, spath, error_msg)
+    finally:
+        if doc is not None:
+            doc.close()
+
+# Prebuilt defaults for error rows; a C-level dict copy beats
+# reconstructing the 14-key literal on every failure
+ERROR_TEMPLATE = {
+    'filename': None,
+    'filepath': None,
+    'has_title': False,
+    'title': None,
+    'has_author': False,
+    'author': None,
+    'has_subject': False,
+    'subject': None,
+    'has_tags': False,
+    'tags': None,
+    'has_date': False,
+    'date': None,
+    'raw_date_string': None,
+    'error': None
+}
+
+def create_error_metadata(filename, filepath, error_msg):
+    """Create metadata dictionary for error cases (names pre-sanitized)."""
+    metadata = ERROR_TEMPLATE.copy()
+    metadata['filename'] = filename
+    metadata['filepath'] = filepath
+    metadata['error'] = error_msg
+    return metadata
+
+# Session-scope metadata cache for the preflight-then-apply workflows
+# (dryrun followed by write parses every file twice otherwise). Keyed
+# on stat identity so rewrites and renames invalidate naturally.
+_metadata_cache = {}
+
+def cached_pdf_metadata(filepath, basename=None):
+    """extract_pdf_metadata memoized on (path, mtime_ns, size)."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return extract_pdf_metadata(filepath, basename)
+    key = (filepath, st.st_mtime_ns, st.st_size)
+    result = _metadata_cache.get(key)
+    if result is None:
+        result = _metadata_cache[key] = extract_pdf_metadata(filepath, basename)
+    return result
+
+@lru_cache(maxsize=4096)
+def _scan_directory(directory, mtime_ns):
+    """List one directory: (subdir paths, [(pdf path, inode key), ...]).
+
+    Cached on (path, mtime_ns) so repeat scans from the menu loop skip
+    the scandir and per-file stats for directories that have not
+    changed; renames bump the directory mtime and invalidate the entry.
+    """
+    subdirs = []
+    pdfs = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            # Lowercase only the extension, not the whole name
+            elif entry.name[-4:].lower() == '.pdf':
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                    inode = (st.st_dev, st.st_ino)
+                except OSError:
+                    inode = None
+                pdfs.append((entry.path, inode))
+    return subdirs, pdfs
+
+def iter_pdfs(root_folder):
+    """Yield paths of all PDFs under root_folder using os.scandir.
+
+    Hardlinked duplicates are yielded only once, keyed by (device, inode).
+    """
+    stack = [root_folder]
+    seen_inodes = set()
+    while stack:
+        directory = stack.pop()
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+            subdirs, pdfs = _scan_directory(directory, mtime_ns)
+        except OSError as e:
+            logger.error(f"Error reading directory {directory}: {e}")
+            continue
+        stack.extend(subdirs)
+        for path, inode in pdfs:
+            if inode is not None:
+                if inode in seen_inodes:
+                    continue
+                seen_inodes.add(inode)
+            yield path
+
+def iter_pdf_metadata(root_folder, max_workers=None):
+    """Yield a metadata dict for every PDF under root_folder.
+
+    Extraction fans out over a process pool; results arrive in
+    traversal order so callers can stream them straight to disk.
+    """
+    filepaths = list(iter_pdfs(root_folder))
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        yield from executor.map(extract_pdf_metadata, filepaths, chunksize=32)
+
+def print_scan_statistics(total_pdfs, processed, error_counts):
+    """Print the post-scan statistics block."""
     print(f"\nPDF Processing Statistics:")
     print(f"Total PDFs found: {total_pdfs}")
-    print(f"Successfully processed (including those with errors): {len(pdf_data)}")
-    print(f"Successfully processed (without errors): {len([d for d in pdf_data if not d.get('error')])}")
-    
+    print(f"Successfully processed (including those with errors): {processed}")
+    print(f"Successfully processed (without errors): {processed - sum(error_counts.values())}")
+
     if error_counts:
         print("\nError Summary:")
         for error_type, count in error_counts.items():
             print(f"- {error_type}: {count} files")
-    
+
+def scan_pdfs(root_folder, max_workers=None):
+    """Recursively scan folder for PDFs and extract metadata."""
+    pdf_data = []
+    error_data = []
+    error_counts = Counter()
+    total_pdfs = 0
+
+    for metadata in iter_pdf_metadata(root_folder, max_workers):
+        total_pdfs += 1
+        if metadata:
+            pdf_data.append(metadata)
+            # Track error types
+            error = metadata.get('error')
+            if error:
+                error_counts[error] += 1
+                # Add to error data
+                error_data.append({
+                    'filename': metadata['filename'],
+                    'filepath': metadata['filepath'],
+                    'error_type': error
+                })
+
+    print_scan_statistics(total_pdfs, len(pdf_data), error_counts)
     return pdf_data, error_data
 
 def metadata_to_csv():
     """Export PDF metadata to CSV files."""
     # Get current datetime for filenames
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    # Scan PDFs and extract metadata
+
+    # Stream each row to CSV as the scan produces it; memory stays flat
+    # regardless of archive size
     print(f"Starting PDF scan in: {PDF_FOLDER}")
-    pdf_data, error_data = scan_pdfs(PDF_FOLDER)
-    
-    # Create DataFrames and save to CSV files
-    if pdf_data:
-        # Save main metadata
-        df = pd.DataFrame(pdf_data)
-        output_file = f"({current_time}) Metadata2CSV.csv"
-        df.to_csv(output_file, index=False)
+    output_file = f"({current_time}) Metadata2CSV.csv"
+    error_output_file = f"({current_time}) Metadata2CSV Errors.csv"
+    rows_written = 0
+    error_counts = Counter()
+    f = error_f = error_writer = None
+
+    try:
+        for metadata in iter_pdf_metadata(PDF_FOLDER):
+            if not metadata:
+                continue
+            if f is None:
+                f = open(output_file, 'w', newline='', buffering=1 << 20)
+                writer = csv.DictWriter(f, fieldnames=METADATA_FIELDS,
+                                        dialect='metapdf')
+                writer.writeheader()
+            writer.writerow(metadata)
+            rows_written += 1
+
+            error = metadata.get('error')
+            if error:
+                error_counts[error] += 1
+                if error_f is None:
+                    error_f = open(error_output_file, 'w', newline='', buffering=1 << 20)
+                    error_writer = csv.DictWriter(
+                        error_f, fieldnames=['filename', 'filepath', 'error_type'],
+                        dialect='metapdf')
+                    error_writer.writeheader()
+                error_writer.writerow({
+                    'filename': metadata['filename'],
+                    'filepath': metadata['filepath'],
+                    'error_type': error
+                })
+    finally:
+        if f is not None:
+            f.close()
+        if error_f is not None:
+            error_f.close()
+
+    print_scan_statistics(rows_written, rows_written, error_counts)
+    if rows_written:
         print(f"\nMetadata saved to {output_file}")
-        
-        # Save error data if any errors occurred
-        if error_data:
-            error_df = pd.DataFrame(error_data)
-            error_output_file = f"({current_time}) Metadata2CSV Errors.csv"
-            error_df.to_csv(error_output_file, index=False)
+        if error_counts:
             print(f"Error data saved to {error_output_file}")
     else:
         print("No PDF files found")
 
+def write_dicts_csv(path, rows, fieldnames=None):
+    """Write a list of row dicts to a CSV file with csv.DictWriter.
+
+    Used where rows were collected in memory anyway (small sidecar
+    outputs); the streaming paths open their writers inline instead.
+    """
+    if fieldnames is None:
+        fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+    with open(path, 'w', newline='', buffering=1 << 20) as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, restval='',
+                                dialect='metapdf')
+        writer.writeheader()
+        writer.writerows(rows)
+
+class ResultSink:
+    """Lazily-opened CSV writers for a batch run's output buckets.
+
+    Takes a mapping of bucket name -> (path, fieldnames). Each file is
+    created on the first row written to its bucket, so empty buckets
+    never leave a CSV behind; rows stream to disk through a 1 MB
+    buffer as they arrive.
+    """
+
+    def __init__(self, sinks):
+        self.sinks = sinks
+        self.files = {}
+        self.writers = {}
+
+    def write(self, kind, row):
+        writer = self.writers.get(kind)
+        if writer is None:
+            output_path, fieldnames = self.sinks[kind]
+            f = open(output_path, 'w', newline='', buffering=1 << 20)
+            self.files[kind] = f
+            writer = csv.DictWriter(f, fieldnames=fieldnames, restval='',
+                                    dialect='metapdf')
+            writer.writeheader()
+            self.writers[kind] = writer
+        writer.writerow(row)
+
+    def written_paths(self):
+        """Paths of the CSVs this run actually created, in sink order."""
+        return [path for kind, (path, _) in self.sinks.items()
+                if kind in self.files]
+
+    def close(self):
+        for f in self.files.values():
+            f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+# Sidecar manifest recording files the batch operations have already
+# handled, keyed by (size, mtime_ns); a rerun skips them with a plain
+# stat sweep instead of re-parsing every PDF. Lives in the scan folder
+# so it travels with the collection.
+MANIFEST_FILENAME = '.metapdf_manifest.json'
+
+def load_manifest(op_name):
+    """Load the manifest and return (full_data, per-op entry dict).
+
+    The per-op dict maps filepath -> [size, mtime_ns]; a missing or
+    unreadable manifest starts empty.
+    """
+    manifest_path = os.path.join(PDF_FOLDER, MANIFEST_FILENAME)
+    try:
+        with open(manifest_path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    return data, data.setdefault(op_name, {})
+
+def save_manifest(data):
+    """Atomically write the manifest back next to the PDFs."""
+    manifest_path = os.path.join(PDF_FOLDER, MANIFEST_FILENAME)
+    temp_path = manifest_path + '.tmp'
+    try:
+        with open(temp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(temp_path, manifest_path)
+    except OSError as e:
+        logger.error(f"Could not save manifest: {e}")
+
+def stat_signature(filepath):
+    """(size, mtime_ns) pair used as the manifest freshness key."""
+    st = os.stat(filepath)
+    return [st.st_size, st.st_mtime_ns]
+
+# Month-name alternations reused by the date patterns
+FULL_MONTHS = (r'January|February|March|April|May|June|July|August'
+               r'|September|October|November|December')
+SHORT_MONTHS = r'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec'
+
+# Date-bearing bracket forms for parse_date_from_parentheses, compiled
+# once at import. These stay as separate collection passes in the
+# original priority order rather than one fused alternation: the forms
+# overlap (an expense bracket's .*? prefix can swallow an earlier
+# compact-date bracket, and a positionally earlier short-month bracket
+# would outrank a later full-month one), so a single left-to-right scan
+# picks different dates and renames files differently.
+PAREN_FULL_DATE_PATTERN = re.compile(
+    r'[\(\[\{](\d{4}-\d{2}-\d{2})[\)\]\}]', re.IGNORECASE)      # (YYYY-MM-DD)
+PAREN_COMPACT_DATE_PATTERN = re.compile(
+    r'[\(\[\{].*?(\d{8}).*?[\)\]\}]', re.IGNORECASE)            # (YYYYMMDD) with extra text
+PAREN_EXPENSE_DATE_PATTERN = re.compile(
+    r'[\(\[\{].*?(\d{4}-\d{4})_\d+[\)\]\}]', re.IGNORECASE)     # (YYYY-MMDD_HHMMSS)
+PAREN_YEAR_PATTERN = re.compile(r'[\(\[\{](\d{4})[\)\]\}]')       # (YYYY)
+PAREN_TEXT_MONTH_YEAR_PATTERN = re.compile(
+    r'[\(\[\{]((?:' + FULL_MONTHS + r'))\s+(\d{4})[\)\]\}]',     # (Month YYYY)
+    re.IGNORECASE)
+PAREN_SHORT_MONTH_PATTERN = re.compile(
+    r'[\(\[\{]((?:' + SHORT_MONTHS + r'))\s+(\d{4})[\)\]\}]',    # (MMM YYYY)
+    re.IGNORECASE)
+PAREN_TEXT_MONTH_RANGE_PATTERN = re.compile(
+    r'[\(\[\{](\d{4})[\)\]\}].*?[\(\[\{]((?:' + FULL_MONTHS + r'))'
+    r'[^\)\]\}]*[\)\]\}]',                                     # (YYYY)...(Month...)
+    re.IGNORECASE)
+PAREN_YEAR_RANGE_PATTERN = re.compile(
+    r'[\(\[\{](\d{4})-(\d{4})[\)\]\}]')                        # (YYYY-YYYY)
+
+# Date-removal patterns for clean_filename, fused into a single alternation
+# so one pass scans the filename instead of fourteen
+CLEAN_DATE_REMOVAL = re.compile('|'.join(f'(?:{p})' for p in [
+    r'[\(\[\{]\d{4}-\d{2}-\d{2}[\)\]\}]',                # (YYYY-MM-DD) or [YYYY-MM-DD] or {YYYY-MM-DD}
+    r'[\(\[\{]\d{8}[^\)\]\}]*[\)\]\}]',                  # (YYYYMMDD) with extra text
+    r'[\(\[\{]\d{4}[\)\]\}]',                            # (YYYY) or [YYYY] or {YYYY}
+    r'[\(\[\{]\d{4}[-_\.]\d{2}[-_\.]\d{2}[\)\]\}]',     # (YYYY-MM-DD) with separators
+    r'[\(\[\{]\d{4}-\d{4}[\)\]\}]',                      # (YYYY-YYYY)
+    r'[\(\[\{]\d{4}-\d{4}_\d+[\)\]\}]',                  # (YYYY-MMDD_HHMMSS)
+    r'[\(\[\{](?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}[\)\]\}]', # (MMM YYYY)
+    r'[\(\[\{](?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}[\)\]\}]', # (Month YYYY)
+    r'[\(\[\{](?:January|February|March|April|May|June|July|August|September|October|November|December)(?:\s*-\s*[A-Za-z]+)?[\)\]\}]',  # {Month - Month}
+    r'[\(\[\{]\d{4}[\)\]\}].*?[\(\[\{](?:January|February|March|April|May|June|July|August|September|October|November|December)[^\)\]\}]*[\)\]\}]', # (YYYY)...(Month...)
+    r'[\[\{\(]\d{4}\s*-\s*\d{4}[\]\}\)]',               # [YYYY - YYYY] or (YYYY - YYYY)
+    r'[\(\[\{]\d{4}[-_\.]\d{2}[\)\]\}]',                # (YYYY-MM)
+    r'[\(\[\{][A-Za-z]+\s*-\s*[A-Za-z]+[\)\]\}]',       # {Month - Month} without year
+    r'[\(\[\{][A-Za-z]+(?:\s*-\s*[A-Za-z]+)?(?:\s+\d{4})?[\)\]\}]',  # {Month - Month YYYY} or {Month YYYY}
+]), re.IGNORECASE)
+
+# Embedded-date patterns for find_embedded_dates, compiled once at import.
+# Each formatter takes (match, year_prefix) and returns
+# (formatted_date, [text fragments to remove]).
+EMBEDDED_DATE_PATTERNS = [
+    # Spaced date after prefix (1991 - 01 - 23 -)
+    (re.compile(r'(\d{4})\s*-\s*(\d{1,2})\s*-\s*(\d{1,2})\s*-\s*'),
+     lambda m, year_prefix: (f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}",
+                             [f"{m.group(0)}"])),  # Include the trailing dash and space
+
+    # Expense report timestamp pattern (2010-0805_162655)
+    (re.compile(r'\s*\(\d{4}-\d{2}\d{2}_\d+\)'),
+     lambda m, year_prefix: (f"{m.group(0)[2:6]}-{m.group(0)[7:9]}-{m.group(0)[9:11]}",
+                             [m.group(0), year_prefix] if year_prefix else [m.group(0)])),
+
+    # Other spaced date format (1991 - 01 - 23)
+    (re.compile(r'(?:^|\s+)(\d{4})\s*-\s*(\d{1,2})\s*-\s*(\d{1,2})(?:\s+|$)'),
+     lambda m, year_prefix: (f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}",
+                             [m.group(0)])),
+]
+
+# Filename-cleanup patterns shared by the rename paths, compiled once
+# at import so the per-file loops hit ready DFAs
+WHITESPACE_RUN_PATTERN = re.compile(r'\s+')
+TRAILING_DASH_PATTERN = re.compile(r'\s*-\s*$')
+LEADING_DATE_PATTERN = re.compile(r'\(\d{4}(?:-\d{2}){0,2}\)\s*(.+)')
+LEADING_DATE_VALUE_PATTERN = re.compile(r'\((\d{4}(?:-\d{2}){0,2})\)')
+YEAR_PREFIX_PATTERN = re.compile(r'\((\d{4})\)\s*(.+)')
+PAREN_GROUP_PATTERN = re.compile(r'\(([^)]+)\)')
+BRACKET_GROUP_PATTERN = re.compile(r'\[([^\]]+)\]')
+DASH_SPACING_PATTERN = re.compile(r'\s*-\s*')
+PDF_EXT_PATTERN = re.compile(r'\.pdf$', re.IGNORECASE)
+FOUR_DIGIT_PATTERN = re.compile(r'\d{4}')
+
+# Post-cleanup normalization passes for clean_filename. These stay as
+# ordered passes rather than one fused alternation: each pass sees the
+# previous pass's output (dash spacing feeds the paren-spacing fixups,
+# bracket removal feeds the final whitespace collapse), and fuzzing a
+# fused single-scan version showed it changes results whenever dashes
+# or empty brackets sit next to parentheses.
+EMPTY_BRACKETS_PATTERN = re.compile(r'[\(\[\{]\s*[\)\]\}]')
+DASH_RUN_PATTERN = re.compile(r'-+')
+OPEN_PAREN_SPACE_PATTERN = re.compile(r'\(\s+')
+SPACE_CLOSE_PAREN_PATTERN = re.compile(r'\s+\)')
+
+# Month-name lookup shared by the date parsers
+MONTH_MAP = {
+    'january': '01', 'february': '02', 'march': '03', 'april': '04',
+    'may': '05', 'june': '06', 'july': '07', 'august': '08',
+    'september': '09', 'october': '10', 'november': '11', 'december': '12',
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+    'jun': '06', 'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+}
+
+# Day limits per month; February is adjusted for leap years below
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def is_valid_ymd(date_str):
+    """True for a real YYYY-MM-DD calendar date.
+
+    Equivalent to the strptime('%Y-%m-%d') check it replaces (including
+    leap-day handling) without re-parsing a format string per call.
+    """
+    if len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-':
+        return False
+    try:
+        year = int(date_str[:4])
+        month = int(date_str[5:7])
+        day = int(date_str[8:10])
+    except ValueError:
+        return False
+    if year < 1 or not 1 <= month <= 12 or day < 1:
+        return False
+    limit = DAYS_IN_MONTH[month - 1]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        limit = 29
+    return day <= limit
+
 def parse_date_from_parentheses(filename):
     """Extract and parse dates from parenthetical expressions in filename."""
-    # First, find all potential date matches
-    date_patterns = {
-        'full_date': r'[\(\[\{](\d{4}-\d{2}-\d{2})[\)\]\}]',  # (YYYY-MM-DD) or [YYYY-MM-DD] or {YYYY-MM-DD}
-        'compact_date': r'[\(\[\{].*?(\d{8}).*?[\)\]\}]',      # (YYYYMMDD) or [YYYYMMDD] or {YYYYMMDD} with possible extra text
-        'year_month': r'[\(\[\{](\d{4})[-_\.](\d{2})[\)\]\}]', # (YYYY-MM) or [YYYY-MM] or {YYYY-MM}
-        'year': r'[\(\[\{](\d{4})[\)\]\}]',                    # (YYYY) or [YYYY] or {YYYY}
-        'text_month_year': r'[\(\[\{]((?:January|February|March|April|May|June|July|August|September|October|November|December))\s+(\d{4})[\)\]\}]', # (Month YYYY)
-        'text_month_range': r'[\(\[\{](\d{4})[\)\]\}].*?[\(\[\{]((?:January|February|March|April|May|June|July|August|September|October|November|December))[^\)\]\}]*[\)\]\}]', # (YYYY)...(Month)
-        'year_range': r'[\(\[\{](\d{4})-(\d{4})[\)\]\}]',      # (YYYY-YYYY) or [YYYY-YYYY] or {YYYY-YYYY}
-        'expense_date': r'[\(\[\{].*?(\d{4}-\d{4})_\d+[\)\]\}]', # (YYYY-MMDD_HHMMSS)
-        'short_month': r'[\(\[\{]((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec))\s+(\d{4})[\)\]\}]', # (MMM YYYY)
-    }
-    
-    month_map = {
-        'january': '01', 'february': '02', 'march': '03', 'april': '04',
-        'may': '05', 'june': '06', 'july': '07', 'august': '08',
-        'september': '09', 'october': '10', 'november': '11', 'december': '12',
-        'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-        'jun': '06', 'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-    }
-    
+    # No bracket character means no pattern can match; skip all regex work
+    if '(' not in filename and '[' not in filename and '{' not in filename:
+        return None
+
     dates = []
-    year_hint = None
-    
-    # First pass: Look for full dates and year hints
-    for pattern_type in ['full_date', 'compact_date']:
-        matches = re.findall(date_patterns[pattern_type], filename, re.IGNORECASE)
-        for match in matches:
-            try:
-                date_str = match if isinstance(match, str) else match[0]
-                if len(date_str) == 8 and date_str.isdigit():  # YYYYMMDD
-                    formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
-                else:
-                    formatted_date = date_str
-                datetime.strptime(formatted_date, "%Y-%m-%d")
-                dates.append(formatted_date)
-            except ValueError:
-                continue
-    
-    # Look for expense report style dates (YYYY-MMDD)
-    matches = re.findall(date_patterns['expense_date'], filename, re.IGNORECASE)
-    for match in matches:
-        try:
-            year, mmdd = match.split('-')
-            formatted_date = f"{year}-{mmdd[:2]}-{mmdd[2:4]}"
-            datetime.strptime(formatted_date, "%Y-%m-%d")
+
+    # First pass: collect full dates in any bracket form
+    for date_str in PAREN_FULL_DATE_PATTERN.findall(filename):
+        if is_valid_ymd(date_str):
+            dates.append(date_str)
+    for date_str in PAREN_COMPACT_DATE_PATTERN.findall(filename):
+        formatted_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
+        if is_valid_ymd(formatted_date):
             dates.append(formatted_date)
-        except (ValueError, IndexError):
-            continue
-    
+
+    # Expense report style dates (YYYY-MMDD_HHMMSS)
+    for match in PAREN_EXPENSE_DATE_PATTERN.findall(filename):
+        year, mmdd = match.split('-')
+        formatted_date = f"{year}-{mmdd[:2]}-{mmdd[2:4]}"
+        if is_valid_ymd(formatted_date):
+            dates.append(formatted_date)
+
     # If we found any full dates, use the earliest one
     if dates:
         return min(dates)
-    
-    # Second pass: Look for year + month combinations
-    year_matches = re.findall(date_patterns['year'], filename)
-    if year_matches:
-        year_hint = year_matches[0]
-    
-    # Look for text month + year combinations
-    for pattern in ['text_month_year', 'short_month']:
-        matches = re.findall(date_patterns[pattern], filename, re.IGNORECASE)
-        for match in matches:
-            month = month_map.get(match[0].lower())
-            year = match[1]
+
+    # Second pass: year + month combinations
+    year_matches = PAREN_YEAR_PATTERN.findall(filename)
+    year_hint = year_matches[0] if year_matches else None
+
+    # Text month + year combinations; full month names outrank
+    # abbreviated ones regardless of position
+    for pattern in (PAREN_TEXT_MONTH_YEAR_PATTERN, PAREN_SHORT_MONTH_PATTERN):
+        for month_name, year in pattern.findall(filename):
+            month = MONTH_MAP.get(month_name.lower())
             if month and year:
                 return f"{year}-{month}-01"
-    
-    # Look for year + text month combinations
+
+    # Year bracket followed by a bare month bracket
     if year_hint:
-        for pattern in ['text_month_range']:
-            matches = re.findall(date_patterns[pattern], filename, re.IGNORECASE)
-            for match in matches:
-                month = month_map.get(match[1].lower())
-                if month:
-                    return f"{year_hint}-{month}-01"
-    
-    # Look for year ranges and use the first year
-    matches = re.findall(date_patterns['year_range'], filename)
-    if matches:
-        year = matches[0][0]  # Use the start year
-        return f"{year}-06-01"
-    
-    # If we have a year hint but nothing else, use mid-year
+        for _, month_name in PAREN_TEXT_MONTH_RANGE_PATTERN.findall(filename):
+            month = MONTH_MAP.get(month_name.lower())
+            if month:
+                return f"{year_hint}-{month}-01"
+
+    # Year ranges: use the start year
+    range_matches = PAREN_YEAR_RANGE_PATTERN.findall(filename)
+    if range_matches:
+        return f"{range_matches[0][0]}-06-01"
+
+    # A year hint but nothing else: use mid-year
     if year_hint:
         return f"{year_hint}-06-01"
-    
+
     return None
 
 def clean_filename(original_filename):
     """Generate cleaned filename with standardized date format."""
+    # No bracket character means nothing to extract or remove
+    if ('(' not in original_filename and '[' not in original_filename
+            and '{' not in original_filename):
+        return original_filename, None
+
     # Extract the best date from all parenthetical expressions
     date_str = parse_date_from_parentheses(original_filename)
     if not date_str:
@@ -287,41 +835,24 @@ def clean_filename(original_filename):
     
     # Remove all parenthetical dates from the filename
     cleaned_name = original_filename
-    date_patterns = [
-        r'[\(\[\{]\d{4}-\d{2}-\d{2}[\)\]\}]',                # (YYYY-MM-DD) or [YYYY-MM-DD] or {YYYY-MM-DD}
-        r'[\(\[\{]\d{8}[^\)\]\}]*[\)\]\}]',                  # (YYYYMMDD) with extra text
-        r'[\(\[\{]\d{4}[\)\]\}]',                            # (YYYY) or [YYYY] or {YYYY}
-        r'[\(\[\{]\d{4}[-_\.]\d{2}[-_\.]\d{2}[\)\]\}]',     # (YYYY-MM-DD) with separators
-        r'[\(\[\{]\d{4}-\d{4}[\)\]\}]',                      # (YYYY-YYYY)
-        r'[\(\[\{]\d{4}-\d{4}_\d+[\)\]\}]',                  # (YYYY-MMDD_HHMMSS)
-        r'[\(\[\{](?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}[\)\]\}]', # (MMM YYYY)
-        r'[\(\[\{](?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}[\)\]\}]', # (Month YYYY)
-        r'[\(\[\{](?:January|February|March|April|May|June|July|August|September|October|November|December)(?:\s*-\s*[A-Za-z]+)?[\)\]\}]',  # {Month - Month}
-        r'[\(\[\{]\d{4}[\)\]\}].*?[\(\[\{](?:January|February|March|April|May|June|July|August|September|October|November|December)[^\)\]\}]*[\)\]\}]', # (YYYY)...(Month...)
-        r'[\[\{\(]\d{4}\s*-\s*\d{4}[\]\}\)]',               # [YYYY - YYYY] or (YYYY - YYYY)
-        r'[\(\[\{]\d{4}[-_\.]\d{2}[\)\]\}]',                # (YYYY-MM)
-        r'[\(\[\{][A-Za-z]+\s*-\s*[A-Za-z]+[\)\]\}]',       # {Month - Month} without year
-        r'[\(\[\{][A-Za-z]+(?:\s*-\s*[A-Za-z]+)?(?:\s+\d{4})?[\)\]\}]',  # {Month - Month YYYY} or {Month YYYY}
-    ]
-    
-    # First pass: remove date-related patterns
-    for pattern in date_patterns:
-        cleaned_name = re.sub(pattern, '', cleaned_name, flags=re.IGNORECASE)
-    
+
+    # First pass: remove date-related patterns in one scan
+    cleaned_name = CLEAN_DATE_REMOVAL.sub('', cleaned_name)
+
     # Clean up any double spaces and strip
-    cleaned_name = re.sub(r'\s+', ' ', cleaned_name).strip()
+    cleaned_name = ' '.join(cleaned_name.split())
     
     # Clean up any empty brackets/parentheses and multiple dashes
-    cleaned_name = re.sub(r'[\(\[\{]\s*[\)\]\}]', '', cleaned_name)
-    cleaned_name = re.sub(r'-+', '-', cleaned_name)
-    
+    cleaned_name = EMPTY_BRACKETS_PATTERN.sub('', cleaned_name)
+    cleaned_name = DASH_RUN_PATTERN.sub('-', cleaned_name)
+
     # Clean up spaces around dashes and parentheses
-    cleaned_name = re.sub(r'\s*-\s*', ' - ', cleaned_name)
-    cleaned_name = re.sub(r'\(\s+', '(', cleaned_name)
-    cleaned_name = re.sub(r'\s+\)', ')', cleaned_name)
-    
+    cleaned_name = DASH_SPACING_PATTERN.sub(' - ', cleaned_name)
+    cleaned_name = OPEN_PAREN_SPACE_PATTERN.sub('(', cleaned_name)
+    cleaned_name = SPACE_CLOSE_PAREN_PATTERN.sub(')', cleaned_name)
+
     # Final cleanup of multiple spaces
-    cleaned_name = re.sub(r'\s+', ' ', cleaned_name).strip()
+    cleaned_name = WHITESPACE_RUN_PATTERN.sub(' ', cleaned_name).strip()
     
     # Remove any trailing/leading dashes after cleanup
     cleaned_name = cleaned_name.strip(' -')
@@ -339,48 +870,46 @@ def clean_dates_dryrun():
     results = []
     files_processed = 0
     files_to_modify = 0
-    
-    # First, get current metadata
-    pdf_data, _ = scan_pdfs(PDF_FOLDER)
-    metadata_map = {item['filepath']: item for item in pdf_data}
-    
-    # Process each PDF file
-    for root, _, files in os.walk(PDF_FOLDER):
-        for filename in files:
-            if not filename.lower().endswith('.pdf'):
-                continue
-                
-            files_processed += 1
-            filepath = os.path.join(root, filename)
-            
-            # Get original metadata
-            metadata = metadata_map.get(filepath, {})
+
+    # Single walk: extract metadata and compute the cleaned name per file
+    for filepath in iter_pdfs(PDF_FOLDER):
+        filename = os.path.basename(filepath)
+        files_processed += 1
+
+        # Process filename
+        cleaned_filename, new_date_str = clean_filename(filename)
+        if cleaned_filename != filename:
+            files_to_modify += 1
+
+            # Only files with a pending change need the PDF opened for
+            # the current-date column
+            metadata = cached_pdf_metadata(filepath, filename)
             original_date = metadata.get('date')
-            
-            # Process filename
-            cleaned_filename, new_date_str = clean_filename(filename)
-            if cleaned_filename != filename:
-                files_to_modify += 1
-                
-                # Create new datetime with noon time
-                if new_date_str:
-                    new_date = f"{new_date_str} 12:00:00"
-                else:
-                    new_date = None
-                
-                results.append({
-                    'filepath': filepath,
-                    'original_filename': filename,
-                    'corrected_filename': cleaned_filename,
-                    'original_pdf_date': original_date,
-                    'corrected_pdf_date': new_date
-                })
+
+            # Create new datetime with noon time
+            if new_date_str:
+                new_date = f"{new_date_str} 12:00:00"
+            else:
+                new_date = None
+
+            results.append({
+                'filepath': filepath,
+                'original_filename': filename,
+                'corrected_filename': cleaned_filename,
+                'original_pdf_date': original_date,
+                'corrected_pdf_date': new_date
+            })
     
     # Save results to CSV
     if results:
-        df = pd.DataFrame(results)
         output_file = f"({current_time}) Clean Dates Preflight.csv"
-        df.to_csv(output_file, index=False)
+        with open(output_file, 'w', newline='', buffering=1 << 20) as f:
+            writer = csv.DictWriter(f, fieldnames=['filepath', 'original_filename',
+                                                   'corrected_filename', 'original_pdf_date',
+                                                   'corrected_pdf_date'],
+                                    dialect='metapdf')
+            writer.writeheader()
+            writer.writerows(results)
         
         print(f"\nClean Dates Preflight Summary:")
         print(f"Total files processed: {files_processed}")
@@ -399,81 +928,100 @@ def clean_dates():
     files_modified = 0
     errors = []
     
-    # Process each PDF file
-    for root, _, files in os.walk(PDF_FOLDER):
-        for filename in files:
-            if not filename.lower().endswith('.pdf'):
-                continue
-                
-            files_processed += 1
-            old_filepath = os.path.join(root, filename)
-            
-            try:
-                # Process filename
-                cleaned_filename, new_date_str = clean_filename(filename)
-                if cleaned_filename != filename:
-                    # Construct new filepath
-                    new_filepath = os.path.join(root, cleaned_filename)
-                    
-                    # Check if destination file already exists
-                    if os.path.exists(new_filepath) and old_filepath.lower() != new_filepath.lower():
-                        error_msg = f"Cannot rename: {cleaned_filename} already exists"
-                        errors.append({
-                            'filepath': old_filepath,
-                            'original_filename': filename,
-                            'intended_filename': cleaned_filename,
-                            'error': error_msg
-                        })
-                        print(f"Error: {error_msg}")
-                        continue
-                    
-                    try:
-                        # Rename the file
-                        os.rename(old_filepath, new_filepath)
-                        files_modified += 1
-                        
-                        # Record the change
-                        results.append({
-                            'original_filepath': old_filepath,
-                            'original_filename': filename,
-                            'new_filepath': new_filepath,
-                            'new_filename': cleaned_filename,
-                            'date_extracted': new_date_str
-                        })
-                        
-                    except OSError as e:
-                        error_msg = f"Failed to rename file: {str(e)}"
-                        errors.append({
-                            'filepath': old_filepath,
-                            'original_filename': filename,
-                            'intended_filename': cleaned_filename,
-                            'error': error_msg
-                        })
-                        print(f"Error: {error_msg}")
-                        
-            except Exception as e:
-                error_msg = f"Error processing file: {str(e)}"
-                errors.append({
-                    'filepath': old_filepath,
-                    'original_filename': filename,
-                    'intended_filename': None,
-                    'error': error_msg
-                })
-                print(f"Error: {error_msg}")
-    
+    # Snapshot the file list up front; we rename files as we go.
+    # One listdir per directory replaces a stat per intended rename.
+    pdf_list = list(iter_pdfs(PDF_FOLDER))
+    dir_entries = {}
+    for old_filepath in pdf_list:
+        root, filename = os.path.split(old_filepath)
+        files_processed += 1
+
+        try:
+            # Process filename
+            cleaned_filename, new_date_str = clean_filename(filename)
+            if cleaned_filename != filename:
+                # Construct new filepath
+                new_filepath = os.path.join(root, cleaned_filename)
+
+                # Check the directory snapshot for an existing file.
+                # Names are stored lowercased: the target filesystem is
+                # case-insensitive, so Report.pdf collides with
+                # report.pdf and a case-sensitive test would let the
+                # rename silently overwrite it
+                existing = dir_entries.get(root)
+                if existing is None:
+                    existing = dir_entries[root] = {
+                        name.lower() for name in os.listdir(root)
+                    }
+                if cleaned_filename.lower() in existing and old_filepath.lower() != new_filepath.lower():
+                    error_msg = f"Cannot rename: {cleaned_filename} already exists"
+                    errors.append({
+                        'filepath': old_filepath,
+                        'original_filename': filename,
+                        'intended_filename': cleaned_filename,
+                        'error': error_msg
+                    })
+                    logger.error(f"Error: {error_msg}")
+                    continue
+
+                try:
+                    # Rename the file and keep the snapshot in sync
+                    os.rename(old_filepath, new_filepath)
+                    existing.discard(filename.lower())
+                    existing.add(cleaned_filename.lower())
+                    files_modified += 1
+
+                    # Record the change
+                    results.append({
+                        'original_filepath': old_filepath,
+                        'original_filename': filename,
+                        'new_filepath': new_filepath,
+                        'new_filename': cleaned_filename,
+                        'date_extracted': new_date_str
+                    })
+
+                except OSError as e:
+                    error_msg = f"Failed to rename file: {str(e)}"
+                    errors.append({
+                        'filepath': old_filepath,
+                        'original_filename': filename,
+                        'intended_filename': cleaned_filename,
+                        'error': error_msg
+                    })
+                    logger.error(f"Error: {error_msg}")
+
+        except Exception as e:
+            error_msg = f"Error processing file: {str(e)}"
+            errors.append({
+                'filepath': old_filepath,
+                'original_filename': filename,
+                'intended_filename': None,
+                'error': error_msg
+            })
+            logger.error(f"Error: {error_msg}")
+
     # Save results to CSV files
     if results:
         # Save successful changes
-        df = pd.DataFrame(results)
         output_file = f"({current_time}) Clean Dates Changes.csv"
-        df.to_csv(output_file, index=False)
+        with open(output_file, 'w', newline='', buffering=1 << 20) as f:
+            writer = csv.DictWriter(f, fieldnames=['original_filepath', 'original_filename',
+                                                   'new_filepath', 'new_filename',
+                                                   'date_extracted'],
+                                    dialect='metapdf')
+            writer.writeheader()
+            writer.writerows(results)
         print(f"\nChanges saved to: {output_file}")
     
     if errors:
         # Save errors
-        error_df = pd.DataFrame(errors)
         error_file = f"({current_time}) Clean Dates Errors.csv"
-        error_df.to_csv(error_file, index=False)
+        with open(error_file, 'w', newline='', buffering=1 << 20) as f:
+            writer = csv.DictWriter(f, fieldnames=['filepath', 'original_filename',
+                                                   'intended_filename', 'error'],
+                                    dialect='metapdf')
+            writer.writeheader()
+            writer.writerows(errors)
         print(f"Errors saved to: {error_file}")
     
     # Print summary
@@ -498,7 +1046,7 @@ def parse_filename_metadata(filename):
     }
     
     # Extract and validate date
-    date_match = re.match(r'\((\d{4}(?:-\d{2}){0,2})\)', filename)
+    date_match = LEADING_DATE_VALUE_PATTERN.match(filename)
     if date_match:
         date_str = date_match.group(1)
         # Handle year-only dates
@@ -513,7 +1061,7 @@ def parse_filename_metadata(filename):
         working_name = filename
     
     # Extract author (first parenthetical after date)
-    author_matches = re.finditer(r'\(([^)]+)\)', working_name)
+    author_matches = PAREN_GROUP_PATTERN.finditer(working_name)
     authors = [m.group(1).strip() for m in author_matches]
     if authors:
         metadata['author'] = authors[0]
@@ -521,15 +1069,15 @@ def parse_filename_metadata(filename):
             metadata['duplicate_authors'] = authors[1:]
     
     # Extract tags (square brackets)
-    tag_matches = re.finditer(r'\[([^\]]+)\]', working_name)
+    tag_matches = BRACKET_GROUP_PATTERN.finditer(working_name)
     metadata['tags'] = [t.group(1).strip() for t in tag_matches]
     
     # Create title (remove date, authors, and tags)
     title = working_name
-    title = re.sub(r'\([^)]+\)', '', title)  # Remove parentheticals
-    title = re.sub(r'\[[^\]]+\]', '', title)  # Remove square brackets
-    title = re.sub(r'\s+', ' ', title)        # Clean up spaces
-    title = re.sub(r'\s*-\s*', ' - ', title)  # Standardize dashes
+    title = PAREN_GROUP_PATTERN.sub('', title)     # Remove parentheticals
+    title = BRACKET_GROUP_PATTERN.sub('', title)   # Remove square brackets
+    title = WHITESPACE_RUN_PATTERN.sub(' ', title)  # Clean up spaces
+    title = DASH_SPACING_PATTERN.sub(' - ', title)  # Standardize dashes
     title = title.strip(' -')                 # Remove leading/trailing dashes and spaces
     metadata['title'] = title if title else None
     
@@ -540,14 +1088,25 @@ def clean_title_string(title):
     if not title:
         return None
     # Remove .pdf extension
-    title = re.sub(r'\.pdf$', '', title, flags=re.IGNORECASE)
+    title = PDF_EXT_PATTERN.sub('', title)
     # Clean up spaces and dashes
-    title = re.sub(r'\s+', ' ', title)
-    title = re.sub(r'\s*-\s*', ' - ', title)
+    title = WHITESPACE_RUN_PATTERN.sub(' ', title)
+    title = DASH_SPACING_PATTERN.sub(' - ', title)
     # Remove trailing spaces and dashes
     title = title.strip(' -')
     return title
 
+def clean_metadata_field(value):
+    """Normalize an existing Title/Subject value in a single pass.
+
+    Strips a trailing .pdf extension, collapses whitespace runs, and
+    trims leading/trailing space and trailing dashes. Equivalent to the
+    old three-pass loop: one iteration already reaches its fixed point.
+    """
+    value = PDF_EXT_PATTERN.sub('', value)
+    value = WHITESPACE_RUN_PATTERN.sub(' ', value)
+    return value.strip().rstrip(' -')
+
 def metadata_write_dryrun():
     """Preview metadata write operations without making changes."""
     print("Starting Metadata Write Preflight...")
@@ -565,104 +1124,98 @@ def metadata_write_dryrun():
     }
     
     # Process each PDF file
-    for root, _, files in os.walk(PDF_FOLDER):
-        for filename in files:
-            if not filename.lower().endswith('.pdf'):
-                continue
-                
-            stats['total_files'] += 1
-            filepath = os.path.join(root, filename)
-            
-            try:
-                # Get current PDF metadata
-                pdf_metadata = extract_pdf_metadata(filepath)
-                
-                # Parse filename metadata
-                filename_metadata = parse_filename_metadata(filename)
-                
-                # Track duplicate authors if found
-                if filename_metadata['duplicate_authors']:
-                    duplicate_authors.append({
-                        'filepath': filepath,
-                        'filename': filename,
-                        'authors': filename_metadata['duplicate_authors']
-                    })
-                
-                # Determine what will be written
-                will_write = {
-                    'date': True,  # Always write date
-                    'author': not pdf_metadata['has_author'],
-                    'tags': True,  # Always append tags if present
-                    'title': not (pdf_metadata['has_title'] or pdf_metadata['has_subject']),
-                    'subject': not (pdf_metadata['has_title'] or pdf_metadata['has_subject'])
-                }
-                
-                # Update statistics
-                if filename_metadata['date']:
-                    stats['datetime_tags'] += 1
-                if will_write['author'] and filename_metadata['author']:
-                    stats['author_tags'] += 1
-                if filename_metadata['tags']:
-                    stats['pdf_tags'] += 1
-                
-                # Check for untagged files (only datetime)
-                if (not filename_metadata['author'] and 
-                    not filename_metadata['tags'] and 
-                    filename_metadata['date']):
-                    stats['untagged_files'] += 1
-                    untagged_files.append({
-                        'filepath': filepath,
-                        'filename': filename
-                    })
-                
-                # Prepare result row
-                result = {
+    pdf_list = list(iter_pdfs(PDF_FOLDER))
+    for filepath in pdf_list:
+        root, filename = os.path.split(filepath)
+        stats['total_files'] += 1
+
+        try:
+            # Get current PDF metadata
+            pdf_metadata = cached_pdf_metadata(filepath)
+
+            # Parse filename metadata
+            filename_metadata = parse_filename_metadata(filename)
+
+            # Track duplicate authors if found
+            if filename_metadata['duplicate_authors']:
+                duplicate_authors.append({
                     'filepath': filepath,
                     'filename': filename,
-                    'current_date': pdf_metadata['date'],
-                    'new_date': filename_metadata['date'],
-                    'current_author': pdf_metadata['author'],
-                    'new_author': filename_metadata['author'] if will_write['author'] else None,
-                    'fn_author': filename_metadata['author'] if not will_write['author'] else None,
-                    'current_tags': pdf_metadata['tags'],
-                    'new_tags': ', '.join(filename_metadata['tags']) if filename_metadata['tags'] else None,
-                    'fn_tags': ', '.join(filename_metadata['tags']),
-                    'current_title': pdf_metadata['title'],
-                    'new_title': filename_metadata['title'] if will_write['title'] else None,
-                    'fn_title': filename_metadata['title'] if not will_write['title'] else None,
-                    'current_subject': pdf_metadata['subject'],
-                    'new_subject': filename_metadata['title'] if will_write['subject'] else None,
-                    'will_write_date': will_write['date'],
-                    'will_write_author': will_write['author'],
-                    'will_write_tags': bool(filename_metadata['tags']),
-                    'will_write_title': will_write['title'],
-                    'will_write_subject': will_write['subject']
-                }
-                
-                results.append(result)
-                
-            except Exception as e:
-                print(f"Error processing {filepath}: {str(e)}")
-    
+                    'authors': filename_metadata['duplicate_authors']
+                })
+
+            # Determine what will be written
+            will_write = {
+                'date': True,  # Always write date
+                'author': not pdf_metadata['has_author'],
+                'tags': True,  # Always append tags if present
+                'title': not (pdf_metadata['has_title'] or pdf_metadata['has_subject']),
+                'subject': not (pdf_metadata['has_title'] or pdf_metadata['has_subject'])
+            }
+
+            # Update statistics
+            if filename_metadata['date']:
+                stats['datetime_tags'] += 1
+            if will_write['author'] and filename_metadata['author']:
+                stats['author_tags'] += 1
+            if filename_metadata['tags']:
+                stats['pdf_tags'] += 1
+
+            # Check for untagged files (only datetime)
+            if (not filename_metadata['author'] and 
+                not filename_metadata['tags'] and 
+                filename_metadata['date']):
+                stats['untagged_files'] += 1
+                untagged_files.append({
+                    'filepath': filepath,
+                    'filename': filename
+                })
+
+            # Prepare result row
+            result = {
+                'filepath': filepath,
+                'filename': filename,
+                'current_date': pdf_metadata['date'],
+                'new_date': filename_metadata['date'],
+                'current_author': pdf_metadata['author'],
+                'new_author': filename_metadata['author'] if will_write['author'] else None,
+                'fn_author': filename_metadata['author'] if not will_write['author'] else None,
+                'current_tags': pdf_metadata['tags'],
+                'new_tags': ', '.join(filename_metadata['tags']) if filename_metadata['tags'] else None,
+                'fn_tags': ', '.join(filename_metadata['tags']),
+                'current_title': pdf_metadata['title'],
+                'new_title': filename_metadata['title'] if will_write['title'] else None,
+                'fn_title': filename_metadata['title'] if not will_write['title'] else None,
+                'current_subject': pdf_metadata['subject'],
+                'new_subject': filename_metadata['title'] if will_write['subject'] else None,
+                'will_write_date': will_write['date'],
+                'will_write_author': will_write['author'],
+                'will_write_tags': bool(filename_metadata['tags']),
+                'will_write_title': will_write['title'],
+                'will_write_subject': will_write['subject']
+            }
+
+            results.append(result)
+
+        except Exception as e:
+            logger.error(f"Error processing {filepath}: {str(e)}")
+
     # Save results to CSV
     if results:
-        df = pd.DataFrame(results)
         output_file = f"({current_time}) Metadata Preflight.csv"
-        df.to_csv(output_file, index=False)
+        write_dicts_csv(output_file, results)
         print(f"\nResults saved to: {output_file}")
     
     # Save untagged files list if any
     if untagged_files:
-        df = pd.DataFrame(untagged_files)
         untagged_file = f"({current_time}) Untagged Files.csv"
-        df.to_csv(untagged_file, index=False)
+        write_dicts_csv(untagged_file, untagged_files)
         print(f"Untagged files list saved to: {untagged_file}")
     
     # Save duplicate authors list if any
     if duplicate_authors:
-        df = pd.DataFrame(duplicate_authors)
         duplicates_file = f"({current_time}) Duplicate Authors.csv"
-        df.to_csv(duplicates_file, index=False)
+        write_dicts_csv(duplicates_file, duplicate_authors)
         print(f"Duplicate authors list saved to: {duplicates_file}")
     
     # Print summary
@@ -675,15 +1228,156 @@ def metadata_write_dryrun():
     if duplicate_authors:
         print(f"Files with duplicate authors: {len(duplicate_authors)}")
 
+def metadata_write_worker(filepath):
+    """Process one PDF for metadata_write; runs in a worker process.
+
+    Returns (kind, row, stat_names) where kind selects the output
+    bucket ('written', 'untagged', 'skipped', 'error') and stat_names
+    lists the summary counters this file contributes to.
+    """
+    filename = os.path.basename(filepath)
+    stat_names = []
+    try:
+        # Check if file is encrypted. The tail probe is only a hint
+        # (a stray /Encrypt in the last 2 KiB must not exclude a
+        # writable file) and this path needs the reader anyway, so go
+        # straight to the authoritative check
+        reader = PdfReader(filepath)
+        if reader.is_encrypted:
+            return ('skipped', {
+                'filepath': filepath,
+                'filename': filename,
+                'reason': 'Encrypted PDF'
+            }, ['encrypted_files'])
+
+        pdf_metadata = extract_pdf_metadata(filepath, filename)
+
+        filename_metadata = parse_filename_metadata(filename)
+
+        # Prepare metadata to write
+        metadata_to_write = {}
+        metadata_written_flags = {
+            'author': False,
+            'tags': False,
+            'title': False,
+            'subject': False
+        }
+
+        # Bind the parsed fields to locals once; the checks below are
+        # pure reads and this keeps repeated dict lookups out of the
+        # per-file path
+        fn_date = filename_metadata['date']
+        fn_author = filename_metadata['author']
+        fn_tags = filename_metadata['tags']
+        fn_title = filename_metadata['title']
+
+        # Process each metadata field...
+        if fn_date:
+            metadata_to_write['/CreationDate'] = f"D:{fn_date.translate(DATE_STRIP_TABLE)}"
+            stat_names.append('datetime_written')
+
+        if fn_author and not pdf_metadata['has_author']:
+            metadata_to_write['/Author'] = fn_author.strip()
+            stat_names.append('author_written')
+            metadata_written_flags['author'] = True
+
+        if fn_tags:
+            # Overwrite tags instead of appending
+            new_tags = ', '.join(fn_tags)
+            metadata_to_write['/Keywords'] = new_tags
+            stat_names.append('tags_written')
+            metadata_written_flags['tags'] = True
+
+        if fn_title:
+            # Don't remove square brackets and their content for title/subject
+            clean_title = clean_title_string(fn_title)
+            if clean_title:
+                # Always write cleaned title if available
+                # Remove the date prefix but preserve bracketed content
+                date_match = LEADING_DATE_PATTERN.match(filename)
+                if date_match:
+                    title_text = date_match.group(1)
+                else:
+                    title_text = fn_title
+
+                # Clean up spaces and remove .pdf extension
+                title_text = PDF_EXT_PATTERN.sub('', title_text)
+                title_text = WHITESPACE_RUN_PATTERN.sub(' ', title_text)
+                title_text = title_text.strip()
+
+                metadata_to_write['/Title'] = title_text
+                metadata_to_write['/Subject'] = title_text
+                stat_names.append('title_written')
+                stat_names.append('subject_written')
+                metadata_written_flags['title'] = True
+                metadata_written_flags['subject'] = True
+
+        # Nothing to write: report the file as untagged without paying
+        # for a clone-rewrite-replace cycle. On a folder that has
+        # already been processed this skips most of the work.
+        if not metadata_to_write:
+            return ('untagged', {
+                'filepath': filepath,
+                'filename': filename,
+                'current_date': pdf_metadata['date'],
+                'current_author': pdf_metadata['author'],
+                'current_title': pdf_metadata['title'],
+                'current_subject': pdf_metadata['subject'],
+                'current_tags': pdf_metadata['tags']
+            }, stat_names)
+
+        # Write metadata to PDF
+        try:
+            # Clone the whole document in one pass instead of re-adding
+            # pages one by one; this also carries over bookmarks and the
+            # existing Info dict, which the page loop silently dropped
+            writer = PdfWriter()
+            writer.clone_document_from_reader(reader)
+
+            # Overwrite with the new metadata
+            writer.add_metadata(metadata_to_write)
+
+            atomic_pdf_write(writer, filepath)
+
+            # Record results
+            if any(metadata_written_flags.values()):
+                return ('written', {
+                    'filepath': filepath,
+                    'filename': filename,
+                    'author': metadata_to_write.get('/Author'),
+                    'title': metadata_to_write.get('/Title'),
+                    'subject': metadata_to_write.get('/Subject'),
+                    'tags': metadata_to_write.get('/Keywords')
+                }, stat_names)
+            return ('untagged', {
+                'filepath': filepath,
+                'filename': filename,
+                'current_date': pdf_metadata['date'],
+                'current_author': pdf_metadata['author'],
+                'current_title': pdf_metadata['title'],
+                'current_subject': pdf_metadata['subject'],
+                'current_tags': pdf_metadata['tags']
+            }, stat_names)
+
+        except Exception as e:
+            return ('error', {
+                'filepath': filepath,
+                'filename': filename,
+                'error': f"Failed to write metadata: {str(e)}"
+            }, stat_names)
+
+    except Exception as e:
+        return ('error', {
+            'filepath': filepath,
+            'filename': filename,
+            'error': f"Error processing file: {str(e)}"
+        }, stat_names)
+
 def metadata_write():
     """Write metadata to PDF files based on filename parsing."""
     print("Starting Metadata Write operation...")
     
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    metadata_written = []
-    untagged_files = []
-    errors = []
-    skipped_files = []
     stats = {
         'total_files': 0,
         'datetime_written': 0,
@@ -691,194 +1385,85 @@ def metadata_write():
         'tags_written': 0,
         'title_written': 0,
         'subject_written': 0,
-        'encrypted_files': 0
+        'encrypted_files': 0,
+        'untagged_files': 0,
+        'errors': 0
     }
-    
+    # Streamed output sinks, opened lazily so empty buckets never
+    # create a file; rows go to disk as they arrive instead of piling
+    # up in memory for an end-of-run dump
+    sinks = {
+        'written': (f"({current_time}) PDF Metadata.csv",
+                    ['filepath', 'filename', 'author', 'title', 'subject', 'tags']),
+        'untagged': (f"({current_time}) Untagged.csv",
+                     ['filepath', 'filename', 'current_date', 'current_author',
+                      'current_title', 'current_subject', 'current_tags']),
+        'skipped': (f"({current_time}) Skipped Files.csv",
+                    ['filepath', 'filename', 'reason']),
+        'error': (f"({current_time}) Metadata Write Errors.csv",
+                  ['filepath', 'filename', 'error'])
+    }
+    sink = ResultSink(sinks)
+
     # First count total PDF files
-    total_pdfs = sum(1 for root, _, files in os.walk(PDF_FOLDER) 
-                    for file in files if file.lower().endswith('.pdf'))
-    print(f"\nFound {total_pdfs} PDF files to process")
-    
-    for root, _, files in os.walk(PDF_FOLDER):
-        for filename in files:
-            if not filename.lower().endswith('.pdf'):
-                continue
-                
-            stats['total_files'] += 1
-            filepath = os.path.join(root, filename)
-            
-            # Show progress
-            print(f"\rProcessing file {stats['total_files']}/{total_pdfs}: {filename[:50]}{'...' if len(filename) > 50 else ''}", end='')
-            
-            try:
-                # Check if file is encrypted
-                print(f"\nChecking encryption status for: {filename}")
-                reader = PdfReader(filepath)
-                if reader.is_encrypted:
-                    print(f"Skipping encrypted file: {filename}")
-                    stats['encrypted_files'] += 1
-                    skipped_files.append({
-                        'filepath': filepath,
-                        'filename': filename,
-                        'reason': 'Encrypted PDF'
-                    })
-                    continue
-                
-                print(f"Extracting current metadata from: {filename}")
-                pdf_metadata = extract_pdf_metadata(filepath)
-                
-                print(f"Parsing filename metadata from: {filename}")
-                filename_metadata = parse_filename_metadata(filename)
-                
-                # Prepare metadata to write
-                metadata_to_write = {}
-                metadata_written_flags = {
-                    'author': False,
-                    'tags': False,
-                    'title': False,
-                    'subject': False
-                }
-                
-                print(f"Processing metadata fields for: {filename}")
-                
-                # Process each metadata field...
-                if filename_metadata['date']:
-                    print("Processing date field...")
-                    metadata_to_write['/CreationDate'] = f"D:{filename_metadata['date'].replace('-', '').replace(' ', '').replace(':', '')}"
-                    stats['datetime_written'] += 1
-                
-                if filename_metadata['author'] and not pdf_metadata['has_author']:
-                    print("Processing author field...")
-                    metadata_to_write['/Author'] = filename_metadata['author'].strip()
-                    stats['author_written'] += 1
-                    metadata_written_flags['author'] = True
-                
-                if filename_metadata['tags']:
-                    print("Processing tags field...")
-                    # Overwrite tags instead of appending
-                    new_tags = ', '.join(filename_metadata['tags'])
-                    metadata_to_write['/Keywords'] = new_tags
-                    stats['tags_written'] += 1
-                    metadata_written_flags['tags'] = True
-                
-                if filename_metadata['title']:
-                    print("Processing title/subject fields...")
-                    # Don't remove square brackets and their content for title/subject
-                    clean_title = clean_title_string(filename_metadata['title'])
-                    if clean_title:
-                        # Always write cleaned title if available
-                        # Remove the date prefix but preserve bracketed content
-                        date_match = re.match(r'\(\d{4}(?:-\d{2}){0,2}\)\s*(.+)', filename)
-                        if date_match:
-                            title_text = date_match.group(1)
-                        else:
-                            title_text = filename_metadata['title']
-                            
-                        # Clean up spaces and remove .pdf extension
-                        title_text = re.sub(r'\.pdf$', '', title_text, flags=re.IGNORECASE)
-                        title_text = re.sub(r'\s+', ' ', title_text)
-                        title_text = title_text.strip()
-                        
-                        metadata_to_write['/Title'] = title_text
-                        metadata_to_write['/Subject'] = title_text
-                        stats['title_written'] += 1
-                        stats['subject_written'] += 1
-                        metadata_written_flags['title'] = True
-                        metadata_written_flags['subject'] = True
-                
-                # Write metadata to PDF
-                try:
-                    print(f"Writing metadata to: {filename}")
-                    writer = PdfWriter()
-                    
-                    print("Copying PDF pages...")
-                    for page in reader.pages:
-                        writer.add_page(page)
-                    
-                    print("Updating metadata...")
-                    # Copy existing metadata first
-                    existing_metadata = reader.metadata
-                    if existing_metadata:
-                        writer.add_metadata(existing_metadata)
-                    # Then overwrite with new metadata
-                    writer.add_metadata(metadata_to_write)
-                    
-                    temp_filepath = filepath + '.tmp'
-                    print(f"Writing temporary file: {os.path.basename(temp_filepath)}")
-                    with open(temp_filepath, 'wb') as output_file:
-                        writer.write(output_file)
-                    
-                    print("Replacing original file...")
-                    os.replace(temp_filepath, filepath)
-                    
-                    # Record results
-                    if any(metadata_written_flags.values()):
-                        print("Recording successful metadata write...")
-                        metadata_written.append({
-                            'filepath': filepath,
-                            'filename': filename,
-                            'author': metadata_to_write.get('/Author'),
-                            'title': metadata_to_write.get('/Title'),
-                            'subject': metadata_to_write.get('/Subject'),
-                            'tags': metadata_to_write.get('/Keywords')
-                        })
-                    else:
-                        print("Recording as untagged file...")
-                        untagged_files.append({
-                            'filepath': filepath,
-                            'filename': filename,
-                            'current_date': pdf_metadata['date'],
-                            'current_author': pdf_metadata['author'],
-                            'current_title': pdf_metadata['title'],
-                            'current_subject': pdf_metadata['subject'],
-                            'current_tags': pdf_metadata['tags']
-                        })
-                    
-                except Exception as e:
-                    error_msg = f"Failed to write metadata: {str(e)}"
-                    errors.append({
-                        'filepath': filepath,
-                        'filename': filename,
-                        'error': error_msg
-                    })
-                    print(f"\nError: {error_msg}")
-                
-            except Exception as e:
-                error_msg = f"Error processing file: {str(e)}"
-                errors.append({
-                    'filepath': filepath,
-                    'filename': filename,
-                    'error': error_msg
-                })
-                print(f"\nError: {error_msg}")
-    
+    pdf_list = list(iter_pdfs(PDF_FOLDER))
+    print(f"\nFound {len(pdf_list)} PDF files")
+
+    # Manifest sweep: files whose (size, mtime_ns) matches what we
+    # recorded on a previous run need no work, so a rerun degrades to
+    # a stat pass over most of the tree
+    manifest_data, manifest = load_manifest('metadata_write')
+    to_process = []
+    for filepath in pdf_list:
+        try:
+            signature = stat_signature(filepath)
+        except OSError:
+            to_process.append(filepath)
+            continue
+        if manifest.get(filepath) != signature:
+            to_process.append(filepath)
+    skipped_unchanged = len(pdf_list) - len(to_process)
+    if skipped_unchanged:
+        print(f"Skipping {skipped_unchanged} files unchanged since the last run")
+    total_pdfs = len(to_process)
+
+    # Each file is an independent read-rewrite-replace cycle, so fan the
+    # work out over a process pool; the parent only aggregates results
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(metadata_write_worker, to_process,
+                                   chunksize=16)
+            for filepath, (kind, row, stat_names) in zip(to_process, results):
+                stats['total_files'] += 1
+
+                # Coalesced progress: one carriage-return line every 50 files
+                if stats['total_files'] % 50 == 0 or stats['total_files'] == total_pdfs:
+                    print(f"\rProcessing file {stats['total_files']}/{total_pdfs}", end='', flush=True)
+
+                for name in stat_names:
+                    stats[name] += 1
+                sink.write(kind, row)
+                if kind == 'untagged':
+                    stats['untagged_files'] += 1
+                elif kind == 'error':
+                    stats['errors'] += 1
+                    logger.error(f"Error: {row['error']}")
+                if kind != 'error':
+                    # Written files get a fresh signature (the rewrite
+                    # bumped their mtime); untagged/skipped are stable
+                    try:
+                        manifest[filepath] = stat_signature(filepath)
+                    except OSError:
+                        manifest.pop(filepath, None)
+    finally:
+        sink.close()
+        save_manifest(manifest_data)
+
     print("\n\nCompleting metadata write process...")
-    
-    # Save results to CSV files
-    if metadata_written:
-        df = pd.DataFrame(metadata_written)
-        output_file = f"({current_time}) PDF Metadata.csv"
-        df.to_csv(output_file, index=False)
-        print(f"\nMetadata write results saved to: {output_file}")
-    
-    if untagged_files:
-        df = pd.DataFrame(untagged_files)
-        untagged_file = f"({current_time}) Untagged.csv"
-        df.to_csv(untagged_file, index=False)
-        print(f"Untagged files list saved to: {untagged_file}")
-    
-    if skipped_files:
-        df = pd.DataFrame(skipped_files)
-        skipped_file = f"({current_time}) Skipped Files.csv"
-        df.to_csv(skipped_file, index=False)
-        print(f"Skipped files list saved to: {skipped_file}")
-    
-    if errors:
-        error_df = pd.DataFrame(errors)
-        error_file = f"({current_time}) Metadata Write Errors.csv"
-        error_df.to_csv(error_file, index=False)
-        print(f"Errors saved to: {error_file}")
-    
+
+    for output_path in sink.written_paths():
+        print(f"{output_path} written")
+
     # Print summary
     print(f"\nMetadata Write Summary:")
     print(f"Total files processed: {stats['total_files']}")
@@ -888,8 +1473,8 @@ def metadata_write():
     print(f"Title tags written: {stats['title_written']}")
     print(f"Subject tags written: {stats['subject_written']}")
     print(f"Encrypted files skipped: {stats['encrypted_files']}")
-    print(f"Untagged files found: {len(untagged_files)}")
-    print(f"Errors encountered: {len(errors)}")
+    print(f"Untagged files found: {stats['untagged_files']}")
+    print(f"Errors encountered: {stats['errors']}")
 
 def display_menu():
     """Display the main menu."""
@@ -953,43 +1538,37 @@ def find_embedded_dates(filename, existing_date=None):
         working_name = filename.replace(f"({existing_date})", "").strip()
     else:
         # Try to find and remove any leading date
-        match = re.match(r'\(\d{4}(?:-\d{2}){0,2}\)\s*(.+)', filename)
+        match = LEADING_DATE_PATTERN.match(filename)
         working_name = match.group(1) if match else filename
     
+    # Every embedded-date pattern needs a four-digit run somewhere, so
+    # one cheap scan settles the common no-date case before the three
+    # pattern passes below. The passes themselves are not fused into an
+    # alternation: the spaced-date forms overlap (the trailing-dash one
+    # is a superstring of the plain one), and a single left-to-right
+    # scan flips which pattern wins, changing the removed text and
+    # therefore the rename output.
+    if FOUR_DIGIT_PATTERN.search(working_name) is None:
+        return None, None
+
     # Store the original year prefix if it exists
-    year_prefix_match = re.match(r'\((\d{4})\)\s*(.+)', filename)
+    year_prefix_match = YEAR_PREFIX_PATTERN.match(filename)
     year_prefix = f"({year_prefix_match.group(1)})" if year_prefix_match else None
     
-    # Patterns for finding embedded dates
-    date_patterns = [
-        # Spaced date after prefix (1991 - 01 - 23)
-        (r'(\d{4})\s*-\s*(\d{1,2})\s*-\s*(\d{1,2})\s*-\s*',  # 1991 - 01 - 23 -
-         lambda m: (f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}", 
-                   [f"{m.group(0)}"])),  # Include the trailing dash and space
-        
-        # Expense report timestamp pattern
-        (r'\s*\(\d{4}-\d{2}\d{2}_\d+\)',                    # (2010-0805_162655)
-         lambda m: (f"{m.group(0)[2:6]}-{m.group(0)[7:9]}-{m.group(0)[9:11]}", 
-                   [m.group(0), year_prefix] if year_prefix else [m.group(0)])),
-        
-        # Other spaced date format
-        (r'(?:^|\s+)(\d{4})\s*-\s*(\d{1,2})\s*-\s*(\d{1,2})(?:\s+|$)',  # 1991 - 01 - 23
-         lambda m: (f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}", [m.group(0)])),
-    ]
-    
-    for pattern, formatter in date_patterns:
-        matches = re.finditer(pattern, working_name)
+    for pattern, formatter in EMBEDDED_DATE_PATTERNS:
+        matches = pattern.finditer(working_name)
         for match in matches:
             try:
-                result = formatter(match)
+                result = formatter(match, year_prefix)
                 if not result:
                     continue
                     
                 formatted_date, text_to_remove = result
-                
+
                 # Validate the date
-                datetime.strptime(formatted_date, "%Y-%m-%d")
-                
+                if not is_valid_ymd(formatted_date):
+                    continue
+
                 # Only return if this is a different/better date than what we already have
                 if not existing_date or formatted_date != existing_date:
                     return formatted_date, text_to_remove
@@ -1005,76 +1584,117 @@ def clean_trailing_separators(filename):
     name, ext = os.path.splitext(filename)
     
     # Clean up multiple spaces
-    name = re.sub(r'\s+', ' ', name)
+    name = WHITESPACE_RUN_PATTERN.sub(' ', name)
     
     # Clean up trailing spaces and separators
     name = name.rstrip()
-    name = re.sub(r'\s*-\s*$', '', name)
+    name = TRAILING_DASH_PATTERN.sub('', name)
     
     return f"{name}{ext}"
 
+# One scan decides whether a filename needs any outlier work at all:
+# a whitespace run or non-space whitespace (separator cleanup would
+# rewrite it), a separator tail before the extension or end of name,
+# or a four-digit run (the minimum any embedded-date pattern needs).
+# Clean names short-circuit both detection passes on this single pass.
+OUTLIER_PREFILTER_PATTERN = re.compile(r'\s{2,}|[^\S ]|[\s\-]\.[^.]*$|[\s\-]$|\d{4}')
+
 def outlier_scan():
     """Scan for and clean up filename outliers and embedded dates."""
     print("Starting Outlier Scan...")
     
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    separator_cleanups = []
-    date_cleanups = []
-    errors = []
+    output_file = f"({current_time}) Outlier Scan Results.csv"
+    error_file = f"({current_time}) Outlier Scan Errors.csv"
+    separator_cleanups = 0
+    date_cleanups = 0
+    error_count = 0
     files_processed = 0
-    
-    for root, _, files in os.walk(PDF_FOLDER):
-        for filename in files:
-            if not filename.lower().endswith('.pdf'):
+    # Stream rows to disk as renames happen instead of accumulating
+    # dicts for an end-of-run dump; memory stays flat and partial
+    # results survive an interrupted scan
+    sink = ResultSink({
+        'result': (output_file,
+                   ['filepath', 'original_filename', 'cleaned_filename',
+                    'cleanup_type', 'original_date', 'new_date']),
+        'error': (error_file,
+                  ['filepath', 'original_filename', 'intended_filename',
+                   'error'])
+    })
+
+    # Snapshot the file list up front; we rename files as we go
+    pdf_list = list(iter_pdfs(PDF_FOLDER))
+
+    # Resume support: paths finished by a previous interrupted run are
+    # listed in the checkpoint file and skipped, so a crash partway
+    # through a long scan costs a rerun of minutes, not hours
+    checkpoint_file = "Outlier Scan Processed.txt"
+    done = set()
+    if os.path.exists(checkpoint_file):
+        with open(checkpoint_file) as f:
+            done = set(f.read().splitlines())
+        print(f"Resuming interrupted scan: skipping {len(done)} already-processed files")
+    checkpoint_f = open(checkpoint_file, 'a', buffering=1 << 16)
+
+    try:
+        for original_filepath in pdf_list:
+            if original_filepath in done:
                 continue
-                
+            filepath = original_filepath
+            root, filename = os.path.split(filepath)
             files_processed += 1
-            filepath = os.path.join(root, filename)
-            
+
+            if not OUTLIER_PREFILTER_PATTERN.search(filename):
+                checkpoint_f.write(original_filepath + '\n')
+                continue
+
             try:
                 # Step 1: Clean trailing separators
                 cleaned_filename = clean_trailing_separators(filename)
                 if cleaned_filename != filename:
                     new_filepath = os.path.join(root, cleaned_filename)
-                    
+
                     # Check if destination file already exists
                     if os.path.exists(new_filepath) and filepath.lower() != new_filepath.lower():
                         error_msg = f"Cannot rename: {cleaned_filename} already exists"
-                        errors.append({
+                        sink.write('error', {
                             'filepath': filepath,
                             'original_filename': filename,
                             'intended_filename': cleaned_filename,
                             'error': error_msg
                         })
-                        print(f"Error: {error_msg}")
+                        error_count += 1
+                        logger.error(f"Error: {error_msg}")
                         continue
-                    
+
                     try:
                         # Rename the file
                         os.rename(filepath, new_filepath)
-                        separator_cleanups.append({
+                        sink.write('result', {
                             'filepath': filepath,
                             'original_filename': filename,
                             'cleaned_filename': cleaned_filename,
                             'cleanup_type': 'trailing_separator'
                         })
+                        separator_cleanups += 1
                         # Update filepath for next step
                         filepath = new_filepath
                         filename = cleaned_filename
                     except OSError as e:
                         error_msg = f"Failed to rename file: {str(e)}"
-                        errors.append({
+                        sink.write('error', {
                             'filepath': filepath,
                             'original_filename': filename,
                             'intended_filename': cleaned_filename,
                             'error': error_msg
                         })
-                        print(f"Error: {error_msg}")
-                
+                        error_count += 1
+                        logger.error(f"Error: {error_msg}")
+
                 # Step 2: Look for embedded dates
-                match = re.match(r'\((\d{4}(?:-\d{2}){0,2})\)', filename)
+                match = LEADING_DATE_VALUE_PATTERN.match(filename)
                 existing_date = match.group(1) if match else None
-                
+
                 embedded_date, text_to_remove = find_embedded_dates(filename, existing_date)
                 if embedded_date and text_to_remove:
                     # Remove all specified text patterns and clean up the filename
@@ -1082,35 +1702,36 @@ def outlier_scan():
                     for text in text_to_remove:
                         working_name = working_name.replace(text, '')
                     working_name = clean_trailing_separators(working_name)
-                    
+
                     # If we found a better date than existing, propose the change
                     if not existing_date or (len(embedded_date) > len(existing_date)):
                         proposed_filename = f"({embedded_date}) {working_name}"
-                        
+
                         print(f"\nFound potential embedded date:")
                         print(f"Original: {filename}")
                         print(f"Proposed: {proposed_filename}")
-                        
+
                         choice = input("Accept this change? (y/n): ").strip().lower()
                         if choice == 'y':
                             new_filepath = os.path.join(root, proposed_filename)
-                            
+
                             # Check if destination file exists
                             if os.path.exists(new_filepath) and filepath.lower() != new_filepath.lower():
                                 error_msg = f"Cannot rename: {proposed_filename} already exists"
-                                errors.append({
+                                sink.write('error', {
                                     'filepath': filepath,
                                     'original_filename': filename,
                                     'intended_filename': proposed_filename,
                                     'error': error_msg
                                 })
-                                print(f"Error: {error_msg}")
+                                error_count += 1
+                                logger.error(f"Error: {error_msg}")
                                 continue
-                            
+
                             try:
                                 # Rename the file
                                 os.rename(filepath, new_filepath)
-                                date_cleanups.append({
+                                sink.write('result', {
                                     'filepath': filepath,
                                     'original_filename': filename,
                                     'cleaned_filename': proposed_filename,
@@ -1118,199 +1739,324 @@ def outlier_scan():
                                     'new_date': embedded_date,
                                     'cleanup_type': 'embedded_date'
                                 })
+                                date_cleanups += 1
                             except OSError as e:
                                 error_msg = f"Failed to rename file: {str(e)}"
-                                errors.append({
+                                sink.write('error', {
                                     'filepath': filepath,
                                     'original_filename': filename,
                                     'intended_filename': proposed_filename,
                                     'error': error_msg
                                 })
-                                print(f"Error: {error_msg}")
-                
-            except Exception as e:
-                error_msg = f"Error processing file: {str(e)}"
-                errors.append({
+                                error_count += 1
+                                logger.error(f"Error: {error_msg}")
+
+            # Known per-file failure modes are all filesystem errors; anything
+            # else is a bug and should surface at main()'s handler
+            except OSError as e:
+                error_msg = f"{e.__class__.__name__}: {e}"
+                sink.write('error', {
                     'filepath': filepath,
                     'original_filename': filename,
                     'intended_filename': None,
                     'error': error_msg
                 })
-                print(f"Error: {error_msg}")
-    
-    # Save results if any changes were found
-    if separator_cleanups or date_cleanups:
-        all_cleanups = separator_cleanups + date_cleanups
-        df = pd.DataFrame(all_cleanups)
-        output_file = f"({current_time}) Outlier Scan Results.csv"
-        df.to_csv(output_file, index=False)
+                error_count += 1
+                logger.error(f"Error: {error_msg}")
+            finally:
+                # Checkpoint the original path whatever happened; renamed
+                # files reappear under their new, already-clean name
+                checkpoint_f.write(original_filepath + '\n')
+                if files_processed % 500 == 0:
+                    checkpoint_f.flush()
+
+    finally:
+        checkpoint_f.close()
+        sink.close()
+
+    # The run completed; the next scan should start from scratch
+    os.remove(checkpoint_file)
+
+    if 'result' in sink.files:
         print(f"\nResults saved to: {output_file}")
-    
-    if errors:
-        error_df = pd.DataFrame(errors)
-        error_file = f"({current_time}) Outlier Scan Errors.csv"
-        error_df.to_csv(error_file, index=False)
+    if 'error' in sink.files:
         print(f"Errors saved to: {error_file}")
-    
+
     # Print summary
     print(f"\nOutlier Scan Summary:")
     print(f"Total files processed: {files_processed}")
-    print(f"Files with trailing separators cleaned: {len(separator_cleanups)}")
-    print(f"Files with embedded dates identified and accepted: {len(date_cleanups)}")
-    print(f"Errors encountered: {len(errors)}")
+    print(f"Files with trailing separators cleaned: {separator_cleanups}")
+    print(f"Files with embedded dates identified and accepted: {date_cleanups}")
+    print(f"Errors encountered: {error_count}")
+
+def clean_fields_worker(filepath):
+    """Clean Title/Subject metadata for one PDF in a worker process.
+
+    Returns (kind, row, stat_names); kind is 'cleaned', 'error', or
+    None when the file needed no work (encrypted, no metadata, or
+    already clean).
+    """
+    filename = os.path.basename(filepath)
+    stat_names = []
+    try:
+        # The trailer probe is only a hint: a hit goes to PyPDF2 for
+        # the authoritative is_encrypted verdict (a stray /Encrypt in
+        # the last 2 KiB must not exclude a writable file), while a
+        # miss keeps the cheap no-reader precheck below
+        reader = None
+        if tail_has_encrypt(filepath):
+            reader = PdfReader(filepath)
+        else:
+            # Cheap precheck: the xref tail-scan hands us Title/Subject
+            # without parsing the whole file. If it works and both
+            # fields are absent or already clean, skip the PdfReader
+            # entirely; a dirty or inconclusive result falls through to
+            # the full parse, which stays authoritative. This leans on
+            # fast_metadata's contract of returning None whenever the
+            # Info dict mentions a field it could not parse (hex
+            # strings, indirect references) and decoding literal-string
+            # escapes exactly as the full parser would, so a missing
+            # key really means the field is absent and a clean value
+            # really is clean
+            info = fast_metadata(filepath)
+            if info is not None:
+                fast_title = info.get('title')
+                fast_subject = info.get('subject')
+                if ((not fast_title or clean_metadata_field(fast_title) == fast_title)
+                        and (not fast_subject
+                             or clean_metadata_field(fast_subject) == fast_subject)):
+                    return (None, None, stat_names)
+
+        # Get current metadata
+        if reader is None:
+            reader = PdfReader(filepath)
+        if reader.is_encrypted:
+            return (None, None, stat_names)
+
+        metadata = reader.metadata
+        if not metadata:
+            return (None, None, stat_names)
+
+        # Check if cleanup needed
+        needs_cleanup = False
+        metadata_to_write = {}
+
+        # Clean Title
+        title = metadata.get('/Title')
+        if title:
+            cleaned_title = clean_metadata_field(title)
+            if cleaned_title != title:
+                metadata_to_write['/Title'] = cleaned_title
+                needs_cleanup = True
+                stat_names.append('title_cleaned')
+
+        # Clean Subject
+        subject = metadata.get('/Subject')
+        if subject:
+            cleaned_subject = clean_metadata_field(subject)
+            if cleaned_subject != subject:
+                metadata_to_write['/Subject'] = cleaned_subject
+                needs_cleanup = True
+                stat_names.append('subject_cleaned')
+
+        if not needs_cleanup:
+            return (None, None, stat_names)
+
+        # Write cleaned metadata
+        try:
+            # Clone the document wholesale rather than re-adding pages
+            # one at a time, keeping bookmarks and untouched Info fields
+            writer = PdfWriter()
+            writer.clone_document_from_reader(reader)
+
+            # Update metadata
+            writer.add_metadata(metadata_to_write)
+
+            # Write updated PDF over the original atomically
+            atomic_pdf_write(writer, filepath)
+
+            stat_names.append('files_cleaned')
+            return ('cleaned', {
+                'filepath': filepath,
+                'filename': filename,
+                'original_title': title,
+                'cleaned_title': metadata_to_write.get('/Title'),
+                'original_subject': subject,
+                'cleaned_subject': metadata_to_write.get('/Subject')
+            }, stat_names)
+
+        except Exception as e:
+            return ('error', {
+                'filepath': filepath,
+                'filename': filename,
+                'error': f"Failed to write cleaned metadata: {str(e)}"
+            }, stat_names)
+
+    except Exception as e:
+        return ('error', {
+            'filepath': filepath,
+            'filename': filename,
+            'error': f"Error processing file: {str(e)}"
+        }, stat_names)
 
 def clean_metadata_fields():
     """Clean up Title and Subject fields in PDF metadata."""
     print("Starting Metadata Field Cleanup...")
     
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    cleaned_files = []
-    errors = []
     stats = {
         'total_files': 0,
         'files_cleaned': 0,
         'title_cleaned': 0,
-        'subject_cleaned': 0
+        'subject_cleaned': 0,
+        'errors': 0
     }
-    
+    # Streamed output sinks, opened lazily on the first row so empty
+    # buckets never create a file
+    sinks = {
+        'cleaned': (f"({current_time}) Clean.csv",
+                    ['filepath', 'filename', 'original_title', 'cleaned_title',
+                     'original_subject', 'cleaned_subject']),
+        'error': (f"({current_time}) Clean Errors.csv",
+                  ['filepath', 'filename', 'error'])
+    }
+    sink = ResultSink(sinks)
+
     # First count total PDF files
-    total_pdfs = sum(1 for root, _, files in os.walk(PDF_FOLDER) 
-                    for file in files if file.lower().endswith('.pdf'))
-    print(f"\nFound {total_pdfs} PDF files to process")
-    
-    for root, _, files in os.walk(PDF_FOLDER):
-        for filename in files:
-            if not filename.lower().endswith('.pdf'):
-                continue
-                
-            stats['total_files'] += 1
-            filepath = os.path.join(root, filename)
-            
-            # Show progress
-            print(f"\rProcessing file {stats['total_files']}/{total_pdfs}: {filename[:50]}{'...' if len(filename) > 50 else ''}", end='')
-            
-            try:
-                # Get current metadata
-                reader = PdfReader(filepath)
-                if reader.is_encrypted:
-                    print(f"\nSkipping encrypted file: {filename}")
-                    continue
-                
-                metadata = reader.metadata
-                if not metadata:
-                    continue
-                
-                # Check if cleanup needed
-                needs_cleanup = False
-                metadata_to_write = {}
-                
-                # Clean Title
-                title = metadata.get('/Title')
-                if title:
-                    # First remove .pdf
-                    cleaned_title = re.sub(r'\.pdf$', '', title, flags=re.IGNORECASE)
-                    # Three passes of cleanup
-                    for _ in range(3):
-                        cleaned_title = cleaned_title.strip()
-                        cleaned_title = re.sub(r'\s+', ' ', cleaned_title)
-                        cleaned_title = re.sub(r'\s*-\s*$', '', cleaned_title)
-                        cleaned_title = cleaned_title.rstrip(' -')
-                    
-                    if cleaned_title != title:
-                        metadata_to_write['/Title'] = cleaned_title
-                        needs_cleanup = True
-                        stats['title_cleaned'] += 1
-                
-                # Clean Subject
-                subject = metadata.get('/Subject')
-                if subject:
-                    # First remove .pdf
-                    cleaned_subject = re.sub(r'\.pdf$', '', subject, flags=re.IGNORECASE)
-                    # Three passes of cleanup
-                    for _ in range(3):
-                        cleaned_subject = cleaned_subject.strip()
-                        cleaned_subject = re.sub(r'\s+', ' ', cleaned_subject)
-                        cleaned_subject = re.sub(r'\s*-\s*$', '', cleaned_subject)
-                        cleaned_subject = cleaned_subject.rstrip(' -')
-                    
-                    if cleaned_subject != subject:
-                        metadata_to_write['/Subject'] = cleaned_subject
-                        needs_cleanup = True
-                        stats['subject_cleaned'] += 1
-                
-                # Write cleaned metadata if needed
-                if needs_cleanup:
+    pdf_list = list(iter_pdfs(PDF_FOLDER))
+    print(f"\nFound {len(pdf_list)} PDF files")
+
+    # Manifest sweep: skip files already confirmed clean (or cleaned by
+    # us) whose size and mtime have not moved since
+    manifest_data, manifest = load_manifest('clean_metadata_fields')
+    to_process = []
+    for filepath in pdf_list:
+        try:
+            signature = stat_signature(filepath)
+        except OSError:
+            to_process.append(filepath)
+            continue
+        if manifest.get(filepath) != signature:
+            to_process.append(filepath)
+    skipped_unchanged = len(pdf_list) - len(to_process)
+    if skipped_unchanged:
+        print(f"Skipping {skipped_unchanged} files unchanged since the last run")
+    total_pdfs = len(to_process)
+
+    # Fan the independent read-clean-rewrite cycles out over a process
+    # pool and aggregate rows and counters in the parent
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(clean_fields_worker, to_process,
+                                   chunksize=16)
+            for filepath, (kind, row, stat_names) in zip(to_process, results):
+                stats['total_files'] += 1
+
+                # Coalesced progress: one carriage-return line every 50 files
+                if stats['total_files'] % 50 == 0 or stats['total_files'] == total_pdfs:
+                    print(f"\rProcessing file {stats['total_files']}/{total_pdfs}", end='', flush=True)
+
+                for name in stat_names:
+                    stats[name] += 1
+                if kind == 'cleaned':
+                    sink.write(kind, row)
+                elif kind == 'error':
+                    stats['errors'] += 1
+                    sink.write(kind, row)
+                    logger.error(f"Error: {row['error']}")
+                if kind != 'error':
+                    # Covers both nothing-to-do files and ones we just
+                    # rewrote (whose mtime moved under us)
                     try:
-                        writer = PdfWriter()
-                        
-                        # Add all pages from reader to writer
-                        for page in reader.pages:
-                            writer.add_page(page)
-                        
-                        # Update metadata
-                        writer.add_metadata(metadata_to_write)
-                        
-                        # Create temporary filename
-                        temp_filepath = filepath + '.tmp'
-                        
-                        # Write updated PDF to temporary file
-                        with open(temp_filepath, 'wb') as output_file:
-                            writer.write(output_file)
-                        
-                        # Replace original with updated file
-                        os.replace(temp_filepath, filepath)
-                        
-                        stats['files_cleaned'] += 1
-                        cleaned_files.append({
-                            'filepath': filepath,
-                            'filename': filename,
-                            'original_title': title,
-                            'cleaned_title': metadata_to_write.get('/Title'),
-                            'original_subject': subject,
-                            'cleaned_subject': metadata_to_write.get('/Subject')
-                        })
-                        print(f"\nCleaned metadata for: {filename}")
-                        
-                    except Exception as e:
-                        error_msg = f"Failed to write cleaned metadata: {str(e)}"
-                        errors.append({
-                            'filepath': filepath,
-                            'filename': filename,
-                            'error': error_msg
-                        })
-                        print(f"\nError: {error_msg}")
-                
-            except Exception as e:
-                error_msg = f"Error processing file: {str(e)}"
-                errors.append({
-                    'filepath': filepath,
-                    'filename': filename,
-                    'error': error_msg
-                })
-                print(f"\nError: {error_msg}")
-    
+                        manifest[filepath] = stat_signature(filepath)
+                    except OSError:
+                        manifest.pop(filepath, None)
+    finally:
+        sink.close()
+        save_manifest(manifest_data)
+
     print("\n\nCompleting cleanup process...")
-    
-    # Save results to CSV
-    if cleaned_files:
-        df = pd.DataFrame(cleaned_files)
-        output_file = f"({current_time}) Clean.csv"
-        df.to_csv(output_file, index=False)
-        print(f"\nCleanup results saved to: {output_file}")
-    
-    if errors:
-        error_df = pd.DataFrame(errors)
-        error_file = f"({current_time}) Clean Errors.csv"
-        error_df.to_csv(error_file, index=False)
-        print(f"Errors saved to: {error_file}")
-    
+
+    for output_path in sink.written_paths():
+        print(f"{output_path} written")
+
     # Print summary
     print(f"\nMetadata Cleanup Summary:")
     print(f"Total files processed: {stats['total_files']}")
     print(f"Files cleaned: {stats['files_cleaned']}")
     print(f"Title fields cleaned: {stats['title_cleaned']}")
     print(f"Subject fields cleaned: {stats['subject_cleaned']}")
-    print(f"Errors encountered: {len(errors)}")
+    print(f"Errors encountered: {stats['errors']}")
+
+def author_import_worker(row):
+    """Apply one corrections-CSV entry; runs in a worker process.
+
+    Returns (metadata_row, rename_row, error_row, stat_names); each row
+    is None when that output does not apply to this entry. A rename
+    collision still reports the metadata row, since the author tag was
+    written before the rename was attempted.
+    """
+    filepath = row['filepath']
+    filename = row['filename']
+    author = row.get('author')
+    try:
+        if not author or not author.strip():
+            return (None, None, None, [])
+
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"File not found: {filepath}")
+
+        reader = PdfReader(filepath)
+        if reader.is_encrypted:
+            return (None, None, None, ['encrypted_files'])
+
+        writer = PdfWriter()
+        writer.clone_document_from_reader(reader)
+        writer.add_metadata({'/Author': author.strip()})
+
+        atomic_pdf_write(writer, filepath)
+        metadata_row = {
+            'filepath': filepath,
+            'filename': filename,
+            'author': author
+        }
+
+        name, ext = os.path.splitext(filename)
+        new_filename = f"{name} - ({author.strip()}){ext}"
+        new_filepath = os.path.join(os.path.dirname(filepath), new_filename)
+
+        try:
+            rename_no_clobber(filepath, new_filepath)
+        except FileExistsError:
+            return (metadata_row, None, {
+                'filepath': filepath,
+                'filename': filename,
+                'error': f"Cannot rename: {new_filename} already exists"
+            }, ['metadata_written'])
+
+        return (metadata_row, {
+            'original_filepath': filepath,
+            'new_filepath': new_filepath,
+            'original_filename': filename,
+            'new_filename': new_filename
+        }, None, ['metadata_written', 'files_renamed'])
+
+    except OSError as e:
+        # Expected failures (missing file, permissions, disk) carry a
+        # self-explanatory message already
+        return (None, None, {
+            'filepath': filepath,
+            'filename': filename,
+            'error': f"Error processing {filepath}: {e}"
+        }, [])
+    except Exception as e:
+        # Anything else (parser blowups etc.) keeps its class name so
+        # the error CSV says what actually went wrong
+        return (None, None, {
+            'filepath': filepath,
+            'filename': filename,
+            'error': f"Error processing {filepath}: {e.__class__.__name__}: {e}"
+        }, [])
 
 def import_author_metadata():
     """Import author metadata from CSV and apply to PDFs and filenames."""
@@ -1323,149 +2069,73 @@ def import_author_metadata():
         return
     
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    metadata_written = []
-    files_renamed = []
-    errors = []
     stats = {
         'total_files': 0,
         'metadata_written': 0,
         'files_renamed': 0,
-        'encrypted_files': 0
+        'encrypted_files': 0,
+        'errors': 0
     }
-    
+    # Stream rows out as entries complete instead of holding the whole
+    # run's results in three lists for an end-of-run dump
+    sink = ResultSink({
+        'written': (f"({current_time}) Author Import Metadata.csv",
+                    ['filepath', 'filename', 'author']),
+        'renamed': (f"({current_time}) Author Import Renames.csv",
+                    ['original_filepath', 'new_filepath',
+                     'original_filename', 'new_filename']),
+        'error': (f"({current_time}) Author Import Errors.csv",
+                  ['filepath', 'filename', 'error'])
+    })
+
     try:
         # Read CSV file
         print(f"Reading CSV file: {csv_path}")
-        df = pd.read_csv(csv_path)
-        print(f"CSV loaded successfully with {len(df)} entries")
-        print("\nCSV columns found:", df.columns.tolist())
-        
-        # Debug: Print first few rows
-        print("\nFirst few entries:")
-        print(df.head())
-        
-        for index, row in df.iterrows():
-            stats['total_files'] += 1
-            try:
-                filepath = str(row['filepath'])
-                filename = str(row['filename'])
-                author = row.get('author')
-                
-                print(f"\nProcessing entry {index + 1}/{len(df)}:")
-                print(f"Filepath: {filepath}")
-                print(f"Filename: {filename}")
-                print(f"Author: {author}")
-                
-                if not author or pd.isna(author):
-                    print("Skipping - No author data")
-                    continue
-                
-                if not os.path.exists(filepath):
-                    print(f"File not found: {filepath}")
-                    raise FileNotFoundError(f"File not found: {filepath}")
-                
-                print("Attempting to read PDF...")
-                reader = PdfReader(filepath)
-                
-                if reader.is_encrypted:
-                    print("File is encrypted - skipping")
-                    stats['encrypted_files'] += 1
-                    continue
-                
-                print("Creating PDF writer...")
-                writer = PdfWriter()
-                
-                print("Copying pages...")
-                for page_num, page in enumerate(reader.pages):
-                    print(f"Copying page {page_num + 1}")
-                    writer.add_page(page)
-                
-                print("Writing author metadata...")
-                writer.add_metadata({'/Author': author.strip()})
-                
-                temp_filepath = filepath + '.tmp'
-                print(f"Writing to temporary file: {temp_filepath}")
-                
-                with open(temp_filepath, 'wb') as output_file:
-                    writer.write(output_file)
-                
-                print("Replacing original file...")
-                os.replace(temp_filepath, filepath)
-                stats['metadata_written'] += 1
-                
-                print("Recording successful metadata write...")
-                metadata_written.append({
-                    'filepath': filepath,
-                    'filename': filename,
-                    'author': author
-                })
-                
-                print("Updating filename...")
-                name, ext = os.path.splitext(filename)
-                new_filename = f"{name} - ({author.strip()}){ext}"
-                new_filepath = os.path.join(os.path.dirname(filepath), new_filename)
-                
-                print(f"New filepath will be: {new_filepath}")
-                
-                if not os.path.exists(new_filepath) or filepath.lower() == new_filepath.lower():
-                    print("Renaming file...")
-                    os.rename(filepath, new_filepath)
-                    stats['files_renamed'] += 1
-                    files_renamed.append({
-                        'original_filepath': filepath,
-                        'new_filepath': new_filepath,
-                        'original_filename': filename,
-                        'new_filename': new_filename
-                    })
-                    print("File renamed successfully")
-                else:
-                    print("Cannot rename - file already exists")
-                    raise FileExistsError(f"Cannot rename: {new_filename} already exists")
-                
-            except Exception as e:
-                error_msg = f"Error processing entry {index + 1}: {str(e)}"
-                errors.append({
-                    'filepath': filepath,
-                    'filename': filename,
-                    'error': error_msg
-                })
-                print(f"Error: {error_msg}")
+        with open(csv_path, newline='') as f:
+            csv_rows = list(csv.DictReader(f))
+        total_rows = len(csv_rows)
+        print(f"CSV loaded successfully with {total_rows} entries")
+        if csv_rows:
+            print("CSV columns found:", list(csv_rows[0]))
+
+        # Entries touch distinct PDFs, so fan the per-entry work out
+        # over a process pool like the other batch drivers; the parent
+        # keeps the sinks and counters
+        # The unconditional per-entry counters live in locals for the
+        # duration of the loop; the stats dict is settled once at the end
+        total_files = 0
+        error_count = 0
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(author_import_worker, csv_rows,
+                                   chunksize=16)
+            for metadata_row, rename_row, error_row, stat_names in results:
+                total_files += 1
+                if total_files % 50 == 0:
+                    print(f"Processed {total_files}/{total_rows} entries...")
+                for name in stat_names:
+                    stats[name] += 1
+                if metadata_row is not None:
+                    sink.write('written', metadata_row)
+                if rename_row is not None:
+                    sink.write('renamed', rename_row)
+                if error_row is not None:
+                    error_count += 1
+                    sink.write('error', error_row)
+                    logger.error(f"Error: {error_row['error']}")
+        stats['total_files'] = total_files
+        stats['errors'] = error_count
     
     except Exception as e:
         print(f"Critical error: {str(e)}")
-        if 'df' in locals():
-            print("\nDataFrame info:")
-            print(df.info())
         return
-    
-    print("\nWriting result files...")
-    
-    # Save results to CSV files
-    if metadata_written:
-        df = pd.DataFrame(metadata_written)
-        output_file = f"({current_time}) Author Import Metadata.csv"
-        df.to_csv(output_file, index=False)
-        print(f"Metadata write results saved to: {output_file}")
-    
-    if files_renamed:
-        df = pd.DataFrame(files_renamed)
-        rename_file = f"({current_time}) Author Import Renames.csv"
-        df.to_csv(rename_file, index=False)
-        print(f"Rename results saved to: {rename_file}")
-    
-    if errors:
-        error_df = pd.DataFrame(errors)
-        error_file = f"({current_time}) Author Import Errors.csv"
-        error_df.to_csv(error_file, index=False)
-        print(f"Errors saved to: {error_file}")
-    
-    # Print summary
-    print(f"\nAuthor Import Summary:")
-    print(f"Total entries processed: {stats['total_files']}")
-    print(f"PDF metadata updated: {stats['metadata_written']}")
-    print(f"Files renamed: {stats['files_renamed']}")
-    print(f"Encrypted files skipped: {stats['encrypted_files']}")
-    print(f"Errors encountered: {len(errors)}")
+    finally:
+        sink.close()
+
+    for output_path in sink.written_paths():
+        print(f"{output_path} written")
+
+    # One write for the whole summary block
+    print(AUTHOR_IMPORT_SUMMARY.format(**stats))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file